@@ -5,6 +5,7 @@
 import os
 import json
 import logging
+import threading
 import traceback
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
@@ -34,6 +35,9 @@ class ActionLogger:
         """
         self.log_dir = log_dir
         
+        # JSONログファイルの読み込み・書き込みの排他（ワーカースレッドからも記録されるため）
+        self._json_lock = threading.Lock()
+        
         # ログディレクトリが存在しない場合は作成
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
@@ -82,36 +86,60 @@ class ActionLogger:
             details: アクションの詳細情報（任意）
             user: アクションを実行したユーザー（デフォルトはシステム）
         """
-        timestamp = datetime.now().isoformat()
-        log_entry = {
-            "timestamp": timestamp,
+        self.log_actions([{
             "action_type": action_type,
             "entity_type": entity_type,
             "entity_id": entity_id,
-            "user": user
-        }
+            "details": details
+        }], user=user)
+    
+    def log_actions(self, actions: List[Dict[str, Any]], user: str = "system") -> None:
+        """
+        複数のアクションをまとめてログに記録
         
-        if details:
-            log_entry["details"] = details
+        JSONログファイルの読み込みと書き込みは1回だけ行う
+        
+        Args:
+            actions: action_type, entity_type, entity_id と任意の details を持つ辞書のリスト
+            user: アクションを実行したユーザー（デフォルトはシステム）
+        """
+        if not actions:
+            return
         
-        # 構造化ログとJSONログの両方を記録
-        self.logger.info(f"{action_type} {entity_type} {entity_id} by {user}")
+        timestamp = datetime.now().isoformat()
+        log_entries = []
+        for action in actions:
+            log_entry = {
+                "timestamp": timestamp,
+                "action_type": action["action_type"],
+                "entity_type": action["entity_type"],
+                "entity_id": action["entity_id"],
+                "user": user
+            }
+            
+            if action.get("details"):
+                log_entry["details"] = action["details"]
+            
+            # 構造化ログとJSONログの両方を記録
+            self.logger.info(f"{action['action_type']} {action['entity_type']} {action['entity_id']} by {user}")
+            log_entries.append(log_entry)
         
         # JSONログをファイルに追記
         json_log_file = os.path.join(self.log_dir, f"actions_{datetime.now().strftime('%Y%m%d')}.json")
-        try:
-            if os.path.exists(json_log_file):
-                with open(json_log_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            else:
-                logs = []
-            
-            logs.append(log_entry)
-            
-            with open(json_log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"Failed to write JSON log: {str(e)}")
+        with self._json_lock:
+            try:
+                if os.path.exists(json_log_file):
+                    with open(json_log_file, 'r', encoding='utf-8') as f:
+                        logs = json.load(f)
+                else:
+                    logs = []
+                
+                logs.extend(log_entries)
+                
+                with open(json_log_file, 'w', encoding='utf-8') as f:
+                    json.dump(logs, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                self.logger.error(f"Failed to write JSON log: {str(e)}")
     
     def log_error(self, level: str, message: str, module: str, function: str, 
                   exception: Optional[Exception] = None, details: Optional[Dict[str, Any]] = None) -> None:
@@ -161,49 +189,64 @@ class ActionLogger:
         
         # JSONエラーログをファイルに追記
         json_error_log_file = os.path.join(self.error_log_dir, f"errors_{datetime.now().strftime('%Y%m%d')}.json")
-        try:
-            if os.path.exists(json_error_log_file):
-                with open(json_error_log_file, 'r', encoding='utf-8') as f:
-                    error_logs = json.load(f)
-            else:
-                error_logs = []
-            
-            error_logs.append(error_entry)
-            
-            with open(json_error_log_file, 'w', encoding='utf-8') as f:
-                json.dump(error_logs, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"Failed to write JSON error log: {str(e)}")
+        with self._json_lock:
+            try:
+                if os.path.exists(json_error_log_file):
+                    with open(json_error_log_file, 'r', encoding='utf-8') as f:
+                        error_logs = json.load(f)
+                else:
+                    error_logs = []
+                
+                error_logs.append(error_entry)
+                
+                with open(json_error_log_file, 'w', encoding='utf-8') as f:
+                    json.dump(error_logs, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                self.logger.error(f"Failed to write JSON error log: {str(e)}")
     
-    def get_entity_history(self, entity_type: str, entity_id: str) -> list:
+    def get_entity_history(self, entity_type: str, entity_id: str,
+                           limit: Optional[int] = None, offset: int = 0) -> list:
         """
         特定のエンティティに関するアクション履歴を取得
         
         Args:
             entity_type: エンティティタイプ (Project, Phase, Process, Task)
             entity_id: エンティティID
+            limit: 取得する最大件数（Noneの場合はすべて）
+            offset: 新しい方から読み飛ばす件数
             
         Returns:
-            エンティティに関するアクション履歴のリスト
+            エンティティに関するアクション履歴のリスト（古い順）
         """
-        history = []
+        # 新しい方から必要な件数（limit 指定時は offset + limit 件）が集まった時点で読み込みを打ち切る
+        wanted = None if limit is None else offset + limit
+        history = []  # 新しい順
         
-        # すべてのJSONログファイルを検索
-        for filename in os.listdir(self.log_dir):
-            if filename.startswith("actions_") and filename.endswith(".json"):
-                file_path = os.path.join(self.log_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        logs = json.load(f)
-                        
-                        # エンティティに関するログをフィルタリング
-                        entity_logs = [log for log in logs if log["entity_type"] == entity_type and log["entity_id"] == entity_id]
-                        history.extend(entity_logs)
-                except Exception as e:
-                    self.logger.error(f"Failed to read log file {filename}: {str(e)}")
+        # JSONログファイルは日付ごとのため、ファイル名の降順が新しい順になる
+        filenames = sorted(
+            (name for name in os.listdir(self.log_dir) if name.startswith("actions_") and name.endswith(".json")),
+            reverse=True
+        )
+        for filename in filenames:
+            file_path = os.path.join(self.log_dir, filename)
+            try:
+                with self._json_lock, open(file_path, 'r', encoding='utf-8') as f:
+                    logs = json.load(f)
+            except Exception as e:
+                self.logger.error(f"Failed to read log file {filename}: {str(e)}")
+                continue
+            
+            # エンティティに関するログをフィルタリング
+            entity_logs = [log for log in logs if log["entity_type"] == entity_type and log["entity_id"] == entity_id]
+            entity_logs.sort(key=lambda x: x["timestamp"], reverse=True)
+            history.extend(entity_logs)
+            
+            if wanted is not None and len(history) >= wanted:
+                break
         
-        # タイムスタンプでソート
-        history.sort(key=lambda x: x["timestamp"])
+        # 新しい方から offset 件を除いた、直近 limit 件を古い順で返す
+        history = history[offset:wanted]
+        history.reverse()
         return history
     
     def get_error_logs(self, level: Optional[str] = None, 
@@ -244,7 +287,7 @@ class ActionLogger:
                     
                     # ファイル内のログを読み込み
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
+                        with self._json_lock, open(file_path, 'r', encoding='utf-8') as f:
                             logs = json.load(f)
                             
                             # 条件でフィルタリング
@@ -311,7 +354,7 @@ class ActionLogger:
         for filename in error_log_files[:3]:
             file_path = os.path.join(self.error_log_dir, filename)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with self._json_lock, open(file_path, 'r', encoding='utf-8') as f:
                     logs = json.load(f)
                     
                     # 統計情報を更新
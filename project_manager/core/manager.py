@@ -2,7 +2,7 @@
 プロジェクト管理コア
 プロジェクト管理システムのコアロジックを担当
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator, Callable
 from datetime import datetime
 
 from ..models import Project, Phase, Process, Task, ProjectStatus, TaskStatus
@@ -10,6 +10,13 @@ from ..storage.data_store import get_data_store
 from ..core.logger import get_logger
 from ..core.error_handler import with_error_logging, LogLevel
 
+# 状態から表示値を引くための表（Enum の value 参照を避ける）
+_PROJECT_STATUS_VALUE = {status: status.value for status in ProjectStatus}
+_TASK_STATUS_VALUE = {status: status.value for status in TaskStatus}
+
+# 省略されていないエンティティID（uuid4 の文字列表現）の長さ
+_FULL_ID_LENGTH = 36
+
 class ProjectManager:
     """
     プロジェクト管理のコア機能を提供するクラス
@@ -21,6 +28,13 @@ class ProjectManager:
         self.data_store = get_data_store()
         self.logger = get_logger()
         self.current_project = None
+        
+        # (フェーズID, プロセスID, タスクID) から (フェーズ, プロセス, タスク) を引く索引
+        self._task_index: Dict[Tuple[str, str, str], Tuple[Phase, Process, Task]] = {}
+        self._task_index_project = None
+        
+        # 一覧情報のキャッシュ（(種類, エンティティID) -> (更新スタンプ, 行のタプル)）
+        self._list_cache: Dict[Tuple[str, str], Tuple[Any, Tuple[Dict[str, Any], ...]]] = {}
     
     # ===== プロジェクト操作 =====
     
@@ -62,6 +76,7 @@ class ProjectManager:
         project = self.data_store.load_project(project_id)
         if project:
             self.current_project = project
+            self._list_cache.clear()
             
             self.logger.log_action(
                 action_type="load",
@@ -122,14 +137,14 @@ class ProjectManager:
         
         if status is not None:
             self.current_project.update_status(status, manual_status)
-            details["status"] = status.value
+            details["status"] = _PROJECT_STATUS_VALUE[status]
             details["manual_status"] = manual_status
         elif not manual_status and not self.current_project.is_status_manual:
             # 自動判定の場合、現在のステータスを更新
             auto_status = self.current_project.determine_status()
             if auto_status != self.current_project.status:
                 self.current_project.update_status(auto_status, False)
-                details["status"] = auto_status.value
+                details["status"] = _PROJECT_STATUS_VALUE[auto_status]
                 details["manual_status"] = False
         
         success = self.save_current_project()
@@ -180,7 +195,7 @@ class ProjectManager:
                 action_type="update",
                 entity_type="Project",
                 entity_id=self.current_project.id,
-                details={"status": self.current_project.status.value, "manual_status": False}
+                details={"status": _PROJECT_STATUS_VALUE[self.current_project.status], "manual_status": False}
             )
         
         return success
@@ -219,6 +234,51 @@ class ProjectManager:
         """
         return self.data_store.list_projects()
     
+    def iter_projects_loaded(self) -> Iterator[Project]:
+        """
+        すべてのプロジェクトを読み込み済みのオブジェクトとして順に取得
+        
+        現在のプロジェクトは読み直さずにメモリ上のものを返し、
+        current_project は変更しない
+        
+        Returns:
+            プロジェクトのイテレータ
+        """
+        current = self.current_project
+        current_id = current.id if current else None
+        
+        for summary in self.list_projects():
+            if summary["id"] == current_id:
+                yield current
+                continue
+            
+            project = self.data_store.load_project(summary["id"])
+            if project:
+                yield project
+    
+    def iter_saved_projects(self, skip_id: Optional[str] = None) -> Iterator[Tuple[str, Optional[Project]]]:
+        """
+        保存済みのすべてのプロジェクトをログを記録せずにファイルから順に読み込む
+        
+        current_project やメモリ上のプロジェクトには触れないため、
+        バックグラウンドスレッドから呼び出せる
+        
+        Args:
+            skip_id: 読み込まずに None を返すプロジェクトのID
+            
+        Returns:
+            (プロジェクトID, プロジェクト) のイテレータ
+        """
+        for summary in self.data_store.list_projects(log=False):
+            project_id = summary["id"]
+            if project_id == skip_id:
+                yield project_id, None
+                continue
+            
+            project = self.data_store.load_project(project_id, log=False)
+            if project:
+                yield project_id, project
+    
     # ===== フェーズ操作 =====
     
     def add_phase(self, name: str, description: str = "") -> Optional[Phase]:
@@ -317,6 +377,7 @@ class ProjectManager:
         
         phase_name = phase.name
         self.current_project.remove_phase(phase_id)
+        self._task_index_project = None
         self.save_current_project()
         
         self.logger.log_action(
@@ -339,12 +400,19 @@ class ProjectManager:
         Returns:
             フェーズ情報のリスト
         """
-        if not self.current_project:
+        project = self.current_project
+        if not project:
             return []
         
-        phases = []
-        for phase in self.current_project.get_phases():
-            phase_info = {
+        # 進捗率や日付は配下のプロセスから算出されるため、プロセスの更新日時もスタンプに含める
+        phases = project.get_phases()
+        stamp = (
+            project.updated_at,
+            max((phase.updated_at for phase in phases), default=None),
+            max((process.updated_at for phase in phases for process in phase.children), default=None)
+        )
+        return self._cached_rows("phases", project, stamp, lambda: [
+            {
                 "id": phase.id,
                 "name": phase.name,
                 "description": phase.description,
@@ -353,9 +421,32 @@ class ProjectManager:
                 "end_date": phase.get_end_date().isoformat() if phase.get_end_date() else None,
                 "process_count": len(phase.get_processes())
             }
-            phases.append(phase_info)
+            for phase in phases
+        ])
+    
+    def _cached_rows(self, kind: str, owner: Any, stamp: Any,
+                     build: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        一覧情報をキャッシュから取得（スタンプが変わっていれば作り直す）
+        
+        キャッシュした行は共有せず、呼び出しごとに複製した辞書を返す
+        
+        Args:
+            kind: 一覧の種類
+            owner: 一覧の親となるエンティティ
+            stamp: 現在の更新スタンプ
+            build: 一覧の行（辞書）のリストを作成する関数
+            
+        Returns:
+            行（辞書）のリスト
+        """
+        key = (kind, owner.id)
+        cached = self._list_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, tuple(build()))
+            self._list_cache[key] = cached
         
-        return phases
+        return [dict(row) for row in cached[1]]
     
     # ===== プロセス操作 =====
     
@@ -498,6 +589,7 @@ class ProjectManager:
         
         process_name = process.name
         phase.remove_process(process_id)
+        self._task_index_project = None
         self.save_current_project()
         
         self.logger.log_action(
@@ -531,23 +623,35 @@ class ProjectManager:
         if not phase:
             return []
         
-        processes = []
-        for process in phase.get_processes():
-            process_info = {
-                "id": process.id,
-                "name": process.name,
-                "description": process.description,
-                "assignee": process.assignee,
-                "progress": process.progress,
-                "start_date": process.start_date.isoformat() if process.start_date else None,
-                "end_date": process.end_date.isoformat() if process.end_date else None,
-                "estimated_hours": process.estimated_hours,
-                "actual_hours": process.actual_hours,
-                "task_count": len(process.get_tasks())
-            }
-            processes.append(process_info)
+        processes = phase.get_processes()
+        stamp = (phase.updated_at, max((process.updated_at for process in processes), default=None))
+        return self._cached_rows(
+            "processes", phase, stamp, lambda: [self.process_to_dict(process) for process in processes]
+        )
+    
+    @staticmethod
+    def process_to_dict(process: Process) -> Dict[str, Any]:
+        """
+        プロセスの一覧表示用の情報を取得
         
-        return processes
+        Args:
+            process: 対象のプロセス
+            
+        Returns:
+            プロセス情報の辞書
+        """
+        return {
+            "id": process.id,
+            "name": process.name,
+            "description": process.description,
+            "assignee": process.assignee,
+            "progress": process.progress,
+            "start_date": process.start_date.isoformat() if process.start_date else None,
+            "end_date": process.end_date.isoformat() if process.end_date else None,
+            "estimated_hours": process.estimated_hours,
+            "actual_hours": process.actual_hours,
+            "task_count": len(process.get_tasks())
+        }
     
     # ===== タスク操作 =====
     
@@ -579,6 +683,8 @@ class ProjectManager:
         
         task = Task(name=name, description=description, status=status)
         process.add_task(task)
+        if self._task_index_project is self.current_project:
+            self._task_index[(phase.id, process.id, task.id)] = (phase, process, task)
         self.save_current_project()
         
         self.logger.log_action(
@@ -587,7 +693,7 @@ class ProjectManager:
             entity_id=task.id,
             details={
                 "name": name,
-                "status": status.value,
+                "status": _TASK_STATUS_VALUE[status],
                 "process_id": process.id,
                 "process_name": process.name,
                 "phase_id": phase.id,
@@ -598,7 +704,8 @@ class ProjectManager:
         return task
     
     def update_task(self, phase_id: str, process_id: str, task_id: str, name: Optional[str] = None, 
-                   description: Optional[str] = None, status: Optional[TaskStatus] = None) -> bool:
+                   description: Optional[str] = None, status: Optional[TaskStatus] = None,
+                   changed_fields: Optional[Set[str]] = None) -> bool:
         """
         タスクを更新
         
@@ -609,25 +716,27 @@ class ProjectManager:
             name: 新しいタスク名（指定された場合）
             description: 新しいタスクの説明（指定された場合）
             status: 新しいタスク状態（指定された場合）
+            changed_fields: 変更されたフィールド名の集合（指定された場合はそれ以外を無視）
             
         Returns:
             更新が成功したかどうか
         """
-        if not self.current_project:
-            return False
-        
-        phase = self.current_project.find_phase(phase_id)
-        if not phase:
-            return False
-        
-        process = phase.find_process(process_id)
-        if not process:
-            return False
-        
-        task = process.find_task(task_id)
-        if not task:
+        resolved = self.resolve_task(phase_id, process_id, task_id)
+        if resolved is None:
             return False
         
+        if changed_fields is not None:
+            # 変更がなければ保存もログ記録も行わない
+            if not changed_fields:
+                return True
+            if "name" not in changed_fields:
+                name = None
+            if "description" not in changed_fields:
+                description = None
+            if "status" not in changed_fields:
+                status = None
+        
+        phase, process, task = resolved
         details = {}
         
         # 基本情報の更新
@@ -643,8 +752,8 @@ class ProjectManager:
             old_status = task.status
             task.update_status(status)
             details["status"] = {
-                "old": old_status.value,
-                "new": status.value
+                "old": _TASK_STATUS_VALUE[old_status],
+                "new": _TASK_STATUS_VALUE[status]
             }
         
         self.save_current_project()
@@ -671,23 +780,14 @@ class ProjectManager:
         Returns:
             削除が成功したかどうか
         """
-        if not self.current_project:
-            return False
-        
-        phase = self.current_project.find_phase(phase_id)
-        if not phase:
-            return False
-        
-        process = phase.find_process(process_id)
-        if not process:
-            return False
-        
-        task = process.find_task(task_id)
-        if not task:
+        resolved = self.resolve_task(phase_id, process_id, task_id)
+        if resolved is None:
             return False
         
+        phase, process, task = resolved
         task_name = task.name
         process.remove_task(task_id)
+        self._task_index.pop((phase_id, process_id, task_id), None)
         self.save_current_project()
         
         self.logger.log_action(
@@ -727,22 +827,97 @@ class ProjectManager:
         if not process:
             return []
         
-        tasks = []
-        for task in process.get_tasks():
-            task_info = {
+        tasks = process.get_tasks()
+        stamp = (process.updated_at, max((task.updated_at for task in tasks), default=None))
+        return self._cached_rows("tasks", process, stamp, lambda: [
+            {
                 "id": task.id,
                 "name": task.name,
                 "description": task.description,
-                "status": task.status.value,
+                "status": _TASK_STATUS_VALUE[task.status],
                 "created_at": task.created_at.isoformat(),
                 "updated_at": task.updated_at.isoformat()
             }
-            tasks.append(task_info)
-        
-        return tasks
+            for task in tasks
+        ])
     
     # ===== 検索・取得機能 =====
     
+    def _build_task_index(self) -> Dict[Tuple[str, str, str], Tuple[Phase, Process, Task]]:
+        """
+        現在のプロジェクトのタスク索引を構築
+        
+        Returns:
+            (フェーズID, プロセスID, タスクID) をキーとする索引
+        """
+        index = {}
+        project = self.current_project
+        if project:
+            for phase in project.get_phases():
+                for process in phase.get_processes():
+                    for task in process.get_tasks():
+                        index[(phase.id, process.id, task.id)] = (phase, process, task)
+        
+        self._task_index = index
+        self._task_index_project = project
+        return index
+    
+    def resolve_task(self, phase_id: str, process_id: str, 
+                     task_id: str) -> Optional[Tuple[Phase, Process, Task]]:
+        """
+        フェーズID・プロセスID・タスクIDからタスクとその親を一度に取得
+        
+        Args:
+            phase_id: タスクが属するフェーズのID
+            process_id: タスクが属するプロセスのID
+            task_id: タスクのID
+            
+        Returns:
+            (フェーズ, プロセス, タスク) のタプル、見つからない場合はNone
+        """
+        project = self.current_project
+        if not project:
+            return None
+        
+        if self._task_index_project is not project:
+            self._build_task_index()
+        
+        key = (phase_id, process_id, task_id)
+        entry = self._task_index.get(key)
+        if entry is not None:
+            phase, process, task = entry
+            if task.parent is process and process.parent is phase and phase.parent is project:
+                return entry
+        
+        # 省略IDは索引に載らないため、作り直さずに見つからないものとする
+        if any(len(entity_id) < _FULL_ID_LENGTH for entity_id in key):
+            return None
+        
+        # 索引作成後に階層が変更された可能性があるため作り直して再検索
+        return self._build_task_index().get(key)
+    
+    def load_saved_task(self, phase_id: str, process_id: str, task_id: str) -> Optional[Task]:
+        """
+        現在のプロジェクトの保存済みファイルからタスクを読み込む
+        
+        メモリ上のプロジェクトは変更しない。他のプロセスによる保存を検出するために使用する
+        
+        Args:
+            phase_id: タスクが属するフェーズのID
+            process_id: タスクが属するプロセスのID
+            task_id: タスクのID
+            
+        Returns:
+            保存済みのタスク、見つからない場合はNone
+        """
+        if not self.current_project:
+            return None
+        
+        project = self.data_store.load_project(self.current_project.id)
+        phase = project.find_phase(phase_id) if project else None
+        process = phase.find_process(process_id) if phase else None
+        return process.find_task(task_id) if process else None
+    
     def find_entity_by_id(self, entity_id: str) -> Tuple[Optional[Any], str, Optional[str], Optional[str]]:
         """
         IDからエンティティを検索
@@ -778,21 +953,24 @@ class ProjectManager:
         
         return None, "", None, None
     
-    def get_entity_history(self, entity_id: str) -> List[Dict[str, Any]]:
+    def get_entity_history(self, entity_id: str, limit: Optional[int] = None,
+                           offset: int = 0) -> List[Dict[str, Any]]:
         """
         エンティティの履歴を取得
         
         Args:
             entity_id: 履歴を取得するエンティティのID
+            limit: 取得する最大件数（Noneの場合はすべて）
+            offset: 新しい方から読み飛ばす件数
             
         Returns:
-            エンティティの履歴リスト
+            エンティティの履歴リスト（古い順）
         """
         entity, entity_type, _, _ = self.find_entity_by_id(entity_id)
         if not entity:
             return []
         
-        return self.logger.get_entity_history(entity_type, entity_id)
+        return self.logger.get_entity_history(entity_type, entity_id, limit=limit, offset=offset)
 
 
 # シングルトンインスタンス
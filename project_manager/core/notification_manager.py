@@ -38,18 +38,10 @@ class NotificationManager:
             生成された通知の数
         """
         project_manager = get_project_manager()
-        projects = project_manager.list_projects()
         new_notifications_count = 0
         
-        # プロジェクトごとに通知条件をチェック
-        for project_info in projects:
-            project_id = project_info["id"]
-            
-            # プロジェクトを読み込む
-            project = project_manager.load_project(project_id)
-            if not project:
-                continue
-                
+        # プロジェクトごとに通知条件をチェック（現在のプロジェクトは切り替えない）
+        for project in project_manager.iter_projects_loaded():
             # プロジェクトの状態が「進行中」または「未着手」の場合のみチェック
             if project.status not in [ProjectStatus.IN_PROGRESS, ProjectStatus.NOT_STARTED]:
                 continue
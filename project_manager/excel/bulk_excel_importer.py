@@ -3,13 +3,76 @@ Excelファイル一括インポーター
 指定したディレクトリから【Gantt】で始まるExcelファイルを一括インポート
 """
 import os
-import glob
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Callable
 
 from ..models import Project
+from ..core.logger import get_logger, LogLevel
 from .excel_importer import ExcelImporter
 
+
+# インポート対象のファイル名（【Ganttから始まるExcelファイル）
+_GANTT_RE = re.compile(r"【Gantt.*\.(?:xlsx|xls|xlsm)", re.DOTALL)
+
+# プロジェクト名から除去する部分（【Gantt Chart】などの括弧書きと拡張子）
+_CLEAN_NAME_RE = re.compile(r"【[^】]*】|\.(?:xlsx|xlsm|xls)$")
+
+
+def _import_one(file_path: str, subdir: str, format_type: str) -> Tuple[Optional[Project], Dict[str, Any]]:
+    """
+    1ファイルをインポートし、プロジェクトと結果詳細を返す（ワーカープロセス用）
+    
+    Args:
+        file_path: インポートするExcelファイルのパス
+        subdir: ファイルのあるサブディレクトリ名
+        format_type: フォーマットタイプ
+        
+    Returns:
+        (インポートされたプロジェクト（失敗した場合はNone）, 結果詳細の辞書)
+    """
+    file_name = os.path.basename(file_path)
+    import_result = {
+        "file_path": file_path,
+        "file_name": file_name,
+        "subdirectory": subdir,
+        "status": "未処理"
+    }
+    
+    try:
+        importer = ExcelImporter()
+        importer.set_format_type(format_type)
+        project = importer.import_from_file(file_path)
+        
+        if not project:
+            import_result["status"] = "失敗"
+            import_result["error"] = "インポートできませんでした（無効なフォーマットの可能性があります）"
+            return None, import_result
+        
+        # ファイル名からプロジェクト名を設定（既に設定されている場合は上書きしない）
+        if project.name == "Excelからインポートしたプロジェクト" or not project.name:
+            # ファイル名から【Gantt Chart】などの部分と拡張子を除去してプロジェクト名に設定
+            clean_name = _CLEAN_NAME_RE.sub("", file_name).strip()
+            project.name = clean_name or subdir
+        
+        # プロジェクト説明にファイルパス情報を追加
+        if not project.description or project.description == "Excelからインポートされました":
+            project.description = f"サブディレクトリ '{subdir}' のファイル '{file_name}' からインポート"
+        else:
+            project.description += f"\n\nサブディレクトリ '{subdir}' のファイル '{file_name}' からインポート"
+        
+        import_result["status"] = "成功"
+        import_result["project_name"] = project.name
+        import_result["phase_count"] = len(project.get_phases())
+        return project, import_result
+    except Exception as e:
+        import_result["status"] = "エラー"
+        import_result["error"] = str(e)
+        return None, import_result
+
+
 class BulkExcelImporter:
     """
     ディレクトリ内のExcelファイルを一括インポートするクラス
@@ -18,6 +81,7 @@ class BulkExcelImporter:
     def __init__(self):
         """一括インポーターの初期化"""
         self.importer = ExcelImporter()
+        self.logger = get_logger()
         
     def set_format_type(self, format_type: str):
         """
@@ -28,12 +92,16 @@ class BulkExcelImporter:
         """
         self.importer.set_format_type(format_type)
     
-    def bulk_import_from_directory(self, directory_path: str) -> Dict[str, Any]:
+    def bulk_import_from_directory(self, directory_path: str,
+                                   progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                                   parallel: bool = True) -> Dict[str, Any]:
         """
         指定ディレクトリの一階層下にある【Ganttから始まるExcelファイルを一括インポート
         
         Args:
             directory_path: 最上位ディレクトリパス
+            progress_callback: 1ファイル処理するごとに (処理済み件数, 総件数, ファイル名) で呼ばれる関数（任意）
+            parallel: Trueの場合はファイルごとに別プロセスで並列にインポートする（Falseはデバッグ用の逐次処理）
             
         Returns:
             インポート結果の辞書（成功件数、失敗件数、詳細など）
@@ -45,85 +113,143 @@ class BulkExcelImporter:
             "projects": []
         }
         
+        # ファイルごとに呼ばれるため、辞書の参照を避けてローカル変数で集計する
+        details = result["details"]
+        append_detail = details.append
+        success_count = 0
+        
+        def on_detail(import_result: Dict[str, Any]):
+            nonlocal success_count
+            if import_result["status"] == "成功":
+                success_count += 1
+            append_detail(import_result)
+        
         try:
-            # ディレクトリの存在確認
-            if not os.path.isdir(directory_path):
-                result["error"] = f"指定されたパス '{directory_path}' はディレクトリではありません"
-                return result
-            
-            # 一階層下のディレクトリを取得
-            subdirs = [d for d in os.listdir(directory_path) 
-                      if os.path.isdir(os.path.join(directory_path, d))]
-            
-            print(f"検索対象サブディレクトリ: {len(subdirs)}個")
-            
-            # 各サブディレクトリ内の【Ganttから始まるExcelファイルをインポート
-            for subdir in subdirs:
-                subdir_path = os.path.join(directory_path, subdir)
-                excel_files = []
-                
-                # 【Ganttから始まるExcelファイルを検索
-                for ext in ['xlsx', 'xls', 'xlsm']:
-                    pattern = os.path.join(subdir_path, "【Gantt*." + ext)
-                    excel_files.extend(glob.glob(pattern))
-                
-                print(f"サブディレクトリ '{subdir}' 内のExcelファイル数: {len(excel_files)}個")
-                
-                # 各ファイルをインポート
-                for file_path in excel_files:
-                    file_name = os.path.basename(file_path)
-                    import_result = {
-                        "file_path": file_path,
-                        "file_name": file_name,
-                        "subdirectory": subdir,
-                        "status": "未処理"
-                    }
-                    
-                    try:
-                        print(f"インポート開始: {file_path}")
-                        project = self.importer.import_from_file(file_path)
-                        
-                        if project:
-                            # ファイル名からプロジェクト名を設定（既に設定されている場合は上書きしない）
-                            if project.name == "Excelからインポートしたプロジェクト" or not project.name:
-                                # ファイル名から【Gantt Chart】などの部分を除去してプロジェクト名に設定
-                                clean_name = file_name.replace(".xlsx", "").replace(".xls", "").replace(".xlsm", "")
-                                # 【Gantt Chart】などの部分を除去
-                                if "【" in clean_name and "】" in clean_name:
-                                    start_idx = clean_name.find("【")
-                                    end_idx = clean_name.find("】") + 1
-                                    prefix = clean_name[start_idx:end_idx]
-                                    clean_name = clean_name.replace(prefix, "").strip()
-                                project.name = clean_name or subdir
-                            
-                            # プロジェクト説明にファイルパス情報を追加
-                            if not project.description or project.description == "Excelからインポートされました":
-                                project.description = f"サブディレクトリ '{subdir}' のファイル '{file_name}' からインポート"
-                            else:
-                                project.description += f"\n\nサブディレクトリ '{subdir}' のファイル '{file_name}' からインポート"
-                            
-                            result["success_count"] += 1
-                            result["projects"].append(project)
-                            import_result["status"] = "成功"
-                            import_result["project_name"] = project.name
-                            import_result["phase_count"] = len(project.get_phases())
-                        else:
-                            result["fail_count"] += 1
-                            import_result["status"] = "失敗"
-                            import_result["error"] = "インポートできませんでした（無効なフォーマットの可能性があります）"
-                    except Exception as e:
-                        result["fail_count"] += 1
-                        import_result["status"] = "エラー"
-                        import_result["error"] = str(e)
-                        print(f"ファイル '{file_path}' のインポート中にエラーが発生: {str(e)}")
-                    
-                    result["details"].append(import_result)
-            
+            result["projects"] = list(self.bulk_import_from_directory_iter(
+                directory_path, on_detail=on_detail,
+                progress_callback=progress_callback, parallel=parallel
+            ))
             return result
             
+        except NotADirectoryError as e:
+            result["error"] = str(e)
+            return result
         except Exception as e:
             result["error"] = f"一括インポート処理中にエラーが発生: {str(e)}"
-            print(f"一括インポート処理中にエラーが発生: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            self.logger.log_error(
+                LogLevel.ERROR, result["error"], __name__, "bulk_import_from_directory", exception=e
+            )
+            if os.environ.get("PM_DEBUG"):
+                import traceback
+                print(traceback.format_exc())
             return result
+        finally:
+            result["success_count"] = success_count
+            result["fail_count"] = len(details) - success_count
+    
+    def _iter_outcomes(self, targets: List[Tuple[str, str]], format_type: str,
+                       parallel: bool) -> Iterator[Tuple[Optional[Project], Dict[str, Any]]]:
+        """
+        対象ファイルをインポートし、結果を完了した順に返す
+        
+        各ファイルは独立しているため、別プロセスで並列にパースする。プロセスプールが
+        使えなくなった場合（ワーカーの異常終了や、プロセスを起動できない環境）は、
+        まだ結果を返していないファイルを同一プロセスで順に処理する
+        
+        Args:
+            targets: (サブディレクトリ名, ファイルパス) のリスト
+            format_type: フォーマットタイプ
+            parallel: Trueの場合は別プロセスで並列に処理する
+            
+        Yields:
+            (インポートされたプロジェクト（失敗した場合はNone）, 結果詳細の辞書)
+        """
+        remaining = dict.fromkeys(targets)
+        
+        if parallel:
+            try:
+                with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(targets))) as executor:
+                    futures = {
+                        executor.submit(_import_one, file_path, subdir, format_type): (subdir, file_path)
+                        for subdir, file_path in targets
+                    }
+                    for future in as_completed(futures):
+                        outcome = future.result()
+                        del remaining[futures[future]]
+                        yield outcome
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.log_error(
+                    LogLevel.WARNING, f"並列インポートを中断し、残り{len(remaining)}件を順に処理します: {e}",
+                    __name__, "_iter_outcomes", exception=e
+                )
+        
+        for subdir, file_path in remaining:
+            yield _import_one(file_path, subdir, format_type)
+    
+    def bulk_import_from_directory_iter(self, directory_path: str,
+                                        on_detail: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                                        parallel: bool = True) -> Iterator[Project]:
+        """
+        指定ディレクトリの一階層下にある【Ganttから始まるExcelファイルを順にインポート
+        
+        インポートできたプロジェクトを1件ずつ返すため、呼び出し側は全件を保持せずに処理できる
+        
+        Args:
+            directory_path: 最上位ディレクトリパス
+            on_detail: 1ファイル処理するごとに結果詳細の辞書で呼ばれる関数（任意）
+            progress_callback: 1ファイル処理するごとに (処理済み件数, 総件数, ファイル名) で呼ばれる関数（任意）
+            parallel: Trueの場合はファイルごとに別プロセスで並列にインポートする（Falseはデバッグ用の逐次処理）
+            
+        Yields:
+            インポートされたプロジェクト
+            
+        Raises:
+            NotADirectoryError: 指定されたパスがディレクトリでない場合
+        """
+        # ディレクトリの存在確認
+        if not os.path.isdir(directory_path):
+            raise NotADirectoryError(f"指定されたパス '{directory_path}' はディレクトリではありません")
+        
+        # 一階層下のディレクトリを取得
+        # （scandir のエントリは種別を保持しているため、項目ごとの stat が不要）
+        with os.scandir(directory_path) as it:
+            subdirs = [entry for entry in it if entry.is_dir()]
+        
+        # 進捗の総件数を確定させるため、先に対象ファイルをすべて列挙
+        targets = []
+        for subdir in subdirs:
+            # 【Ganttから始まるExcelファイルを1回の走査で検索
+            with os.scandir(subdir.path) as it:
+                excel_files = [entry.path for entry in it
+                               if _GANTT_RE.fullmatch(entry.name) and entry.is_file()]
+            targets.extend((subdir.name, file_path) for file_path in excel_files)
+        
+        total = len(targets)
+        format_type = self.importer.format_type
+        
+        # ファイルごとの状況は on_detail / progress_callback で通知し、ログには最後に集計のみ記録する
+        success_count = 0
+        if targets:
+            outcomes = self._iter_outcomes(targets, format_type, parallel and total > 1)
+            for done, (project, import_result) in enumerate(outcomes, 1):
+                if on_detail:
+                    on_detail(import_result)
+                
+                if progress_callback:
+                    progress_callback(done, total, import_result["file_name"])
+                
+                if project:
+                    success_count += 1
+                    yield project
+        
+        self.logger.log_action(
+            action_type="bulk_import",
+            entity_type="Directory",
+            entity_id=directory_path,
+            details={
+                "subdirectory_count": len(subdirs),
+                "file_count": total,
+                "success_count": success_count
+            }
+        )
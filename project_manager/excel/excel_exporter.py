@@ -10,8 +10,18 @@ import openpyxl
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 
+try:
+    # xlsxwriter がある場合、テンプレートを使わない書き出しは行単位のストリーミングで行う
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 from ..models import Project, Phase, Process, Task, ProjectStatus, TaskStatus
-from .excel_utils import set_cell_value
+from .excel_utils import set_cell_value, set_cell_value_rc
+
+
+# xlsxwriter で書き出す日時セルの表示形式（openpyxl の既定と揃える）
+_XLSX_DATETIME_FORMAT = "yyyy-mm-dd h:mm:ss"
 
 
 class ExcelExporter:
@@ -36,6 +46,11 @@ class ExcelExporter:
             エクスポートが成功したかどうか
         """
         try:
+            # テンプレートを使わない場合は xlsxwriter で直接書き出す
+            if not self._has_template and xlsxwriter is not None:
+                self._export_with_xlsxwriter(project, file_path)
+                return True
+            
             # テンプレートが存在する場合は使用、なければ新規作成
             if self._has_template:
                 workbook = openpyxl.load_workbook(self.template_path)
@@ -60,6 +75,72 @@ class ExcelExporter:
             print(f"Excelのエクスポート中にエラーが発生しました: {str(e)}")
             return False
     
+    def _export_with_xlsxwriter(self, project: Project, file_path: str) -> None:
+        """
+        xlsxwriter の constant_memory モードでプロジェクトを書き出す
+        
+        各シートを上の行から順に1行ずつ書き込むため、プロジェクトの規模によらず
+        メモリ使用量が一定になる。レイアウトは openpyxl での書き出しと同じ
+        
+        Args:
+            project: エクスポートするプロジェクト
+            file_path: 出力先のファイルパス
+        """
+        workbook = xlsxwriter.Workbook(file_path, {
+            "constant_memory": True,
+            "strings_to_numbers": False,
+            "default_date_format": _XLSX_DATETIME_FORMAT
+        })
+        
+        try:
+            phases = project.get_phases()
+            
+            # スケジュールシート（行・列は0始まり、B列 = 1）
+            schedule_sheet = workbook.add_worksheet("スケジュール")
+            schedule_sheet.write(1, 1, project.name)
+            schedule_sheet.write_row(6, 1, ["ID", "名前", "担当者", "進捗", "開始日", "終了日", "予想工数", "実工数"])
+            
+            row = 7
+            for phase_idx, phase in enumerate(phases):
+                phase_id = chr(65 + phase_idx + 1)
+                schedule_sheet.write_row(row, 1, [
+                    phase_id, phase.name, None, f"{phase.calculate_progress():.1f}%",
+                    phase.get_start_date(), phase.get_end_date()
+                ])
+                row += 1
+                
+                for process_idx, process in enumerate(phase.get_processes()):
+                    schedule_sheet.write_row(row, 1, [
+                        f"{phase_id}{process_idx + 1}", process.name, process.assignee,
+                        f"{process.progress:.1f}%", process.start_date, process.end_date,
+                        process.estimated_hours, process.actual_hours
+                    ])
+                    row += 1
+            
+            # 入力シート（I6:M6 にフェーズ名、I7:M36 にプロセス名）
+            input_sheet = workbook.add_worksheet("入力")
+            columns = [
+                [process.name for process in phase.get_processes()[:30]]
+                for phase in phases[:5]
+            ]
+            input_sheet.write_row(5, 8, [phase.name for phase in phases[:5]])
+            for j in range(max(map(len, columns), default=0)):
+                input_sheet.write_row(6 + j, 8, [names[j] if j < len(names) else None for names in columns])
+            
+            # タスクシート
+            for phase_idx, phase in enumerate(phases):
+                phase_id = chr(65 + phase_idx + 1)
+                for process_idx, process in enumerate(phase.get_processes()):
+                    task_sheet = workbook.add_worksheet(f"{phase_id}{process_idx + 1}")
+                    task_sheet.write(2, 1, f"プロセス: {process.name}")
+                    task_sheet.write(3, 1, f"担当者: {process.assignee}")
+                    task_sheet.write(4, 1, "タスク一覧:")
+                    
+                    for task_idx, task in enumerate(process.get_tasks()[:12]):  # 最大12タスクまで
+                        task_sheet.write_row(5 + task_idx, 1, [task.name, task.status.value])
+        finally:
+            workbook.close()
+    
     def _create_default_sheets(self, workbook):
         """
         デフォルトのシート構造を作成
@@ -90,8 +171,7 @@ class ExcelExporter:
         # 列ヘッダー
         headers = ["ID", "名前", "担当者", "進捗", "開始日", "終了日", "予想工数", "実工数"]
         for i, header in enumerate(headers):
-            col = chr(66 + i)  # B, C, D, ...
-            set_cell_value(schedule_sheet, f"{col}7", header)
+            set_cell_value_rc(schedule_sheet, 7, 2 + i, header)  # B, C, D, ...
         
         # フェーズとプロセスを書き込む
         row = 8
@@ -100,14 +180,14 @@ class ExcelExporter:
             phase_id = chr(65 + phase_idx + 1)  # A, B, C, ...
             
             # フェーズ行
-            set_cell_value(schedule_sheet, f"B{row}", phase_id)
-            set_cell_value(schedule_sheet, f"C{row}", phase.name)
-            set_cell_value(schedule_sheet, f"E{row}", f"{phase.calculate_progress():.1f}%")
+            set_cell_value_rc(schedule_sheet, row, 2, phase_id)
+            set_cell_value_rc(schedule_sheet, row, 3, phase.name)
+            set_cell_value_rc(schedule_sheet, row, 5, f"{phase.calculate_progress():.1f}%")
             
             if phase.get_start_date():
-                set_cell_value(schedule_sheet, f"F{row}", phase.get_start_date())
+                set_cell_value_rc(schedule_sheet, row, 6, phase.get_start_date())
             if phase.get_end_date():
-                set_cell_value(schedule_sheet, f"G{row}", phase.get_end_date())
+                set_cell_value_rc(schedule_sheet, row, 7, phase.get_end_date())
             
             row += 1
             
@@ -115,18 +195,18 @@ class ExcelExporter:
             for process_idx, process in enumerate(phase.get_processes()):
                 process_id = f"{phase_id}{process_idx + 1}"
                 
-                set_cell_value(schedule_sheet, f"B{row}", process_id)
-                set_cell_value(schedule_sheet, f"C{row}", process.name)
-                set_cell_value(schedule_sheet, f"D{row}", process.assignee)
-                set_cell_value(schedule_sheet, f"E{row}", f"{process.progress:.1f}%")
+                set_cell_value_rc(schedule_sheet, row, 2, process_id)
+                set_cell_value_rc(schedule_sheet, row, 3, process.name)
+                set_cell_value_rc(schedule_sheet, row, 4, process.assignee)
+                set_cell_value_rc(schedule_sheet, row, 5, f"{process.progress:.1f}%")
                 
                 if process.start_date:
-                    set_cell_value(schedule_sheet, f"F{row}", process.start_date)
+                    set_cell_value_rc(schedule_sheet, row, 6, process.start_date)
                 if process.end_date:
-                    set_cell_value(schedule_sheet, f"G{row}", process.end_date)
+                    set_cell_value_rc(schedule_sheet, row, 7, process.end_date)
                 
-                set_cell_value(schedule_sheet, f"H{row}", process.estimated_hours)
-                set_cell_value(schedule_sheet, f"I{row}", process.actual_hours)
+                set_cell_value_rc(schedule_sheet, row, 8, process.estimated_hours)
+                set_cell_value_rc(schedule_sheet, row, 9, process.actual_hours)
                 
                 row += 1
     
@@ -143,17 +223,16 @@ class ExcelExporter:
         # フェーズ名を設定 (I6:M6)
         phases = project.get_phases()
         for i, phase in enumerate(phases[:5]):  # 最大5フェーズまで
-            col = chr(73 + i)  # I, J, K, ...
-            set_cell_value(input_sheet, f"{col}6", phase.name)
+            set_cell_value_rc(input_sheet, 6, 9 + i, phase.name)  # I, J, K, ...
         
         # プロセスを設定 (I7:M36)
         for i, phase in enumerate(phases[:5]):
-            col = chr(73 + i)  # I, J, K, ...
+            col = 9 + i  # I, J, K, ...
             processes = phase.get_processes()
             
             for j, process in enumerate(processes[:30]):  # 最大30プロセスまで
                 row = 7 + j
-                set_cell_value(input_sheet, f"{col}{row}", process.name)
+                set_cell_value_rc(input_sheet, row, col, process.name)
     
     def _create_task_sheets(self, workbook, project: Project):
         """
@@ -193,5 +272,5 @@ class ExcelExporter:
                 for task_idx, task in enumerate(process.get_tasks()):
                     row = 6 + task_idx
                     if task_idx < 12:  # 最大12タスクまで
-                        set_cell_value(task_sheet, f"B{row}", task.name)
-                        set_cell_value(task_sheet, f"C{row}", task.status.value)
+                        set_cell_value_rc(task_sheet, row, 2, task.name)
+                        set_cell_value_rc(task_sheet, row, 3, task.status.value)
@@ -13,7 +13,33 @@ import openpyxl
 from openpyxl.worksheet.worksheet import Worksheet
 
 from ..models import Project, Phase, Process, Task, ProjectStatus, TaskStatus
-from .excel_utils import get_cell_value, find_last_row_with_data, parse_excel_date
+from .excel_utils import get_cell_value, get_cell_value_rc, find_last_row_with_data, parse_excel_date
+
+
+# プロセスシート内のタスク一覧の範囲（B6:C17、B列がタスク名・C列が状態）
+_TASK_FIRST_ROW = 6
+_TASK_LAST_ROW = 17
+
+
+def _read_task_rows(sheet) -> List[Tuple[Any, Any]]:
+    """
+    プロセスシートからタスク一覧の範囲を読み取る
+    
+    範囲をまとめて値のみで取得するため、セルごとのアドレス解決を行わない
+    
+    Args:
+        sheet: プロセスシート
+        
+    Returns:
+        (タスク名, 状態文字列) のリスト（タスク名が空の行は除く）
+    """
+    return [
+        (task_name, task_status_str)
+        for task_name, task_status_str in sheet.iter_rows(
+            min_row=_TASK_FIRST_ROW, max_row=_TASK_LAST_ROW, min_col=2, max_col=3, values_only=True
+        )
+        if task_name
+    ]
 
 
 class ExcelImporter:
@@ -884,8 +910,8 @@ class ExcelImporter:
         last_row = find_last_row_with_data(schedule_sheet, "B")
         
         for row in range(8, last_row + 1):
-            id_value = get_cell_value(schedule_sheet, f"B{row}")
-            name_value = get_cell_value(schedule_sheet, f"C{row}")
+            id_value = get_cell_value_rc(schedule_sheet, row, 2)
+            name_value = get_cell_value_rc(schedule_sheet, row, 3)
             
             if not id_value or not name_value:
                 continue
@@ -904,12 +930,12 @@ class ExcelImporter:
                 print(f"フェーズを追加: {name_value}, ID: {id_str}")
             elif any(c.isdigit() for c in id_str) and any(c.isalpha() for c in id_str):
                 # プロセス
-                assignee = get_cell_value(schedule_sheet, f"D{row}") or ""
-                start_date = parse_excel_date(get_cell_value(schedule_sheet, f"F{row}"))
-                end_date = parse_excel_date(get_cell_value(schedule_sheet, f"G{row}"))
+                assignee = get_cell_value_rc(schedule_sheet, row, 4) or ""
+                start_date = parse_excel_date(get_cell_value_rc(schedule_sheet, row, 6))
+                end_date = parse_excel_date(get_cell_value_rc(schedule_sheet, row, 7))
                 
-                estimated_hours = get_cell_value(schedule_sheet, f"H{row}") or 0.0
-                actual_hours = get_cell_value(schedule_sheet, f"I{row}") or 0.0
+                estimated_hours = get_cell_value_rc(schedule_sheet, row, 8) or 0.0
+                actual_hours = get_cell_value_rc(schedule_sheet, row, 9) or 0.0
                 
                 # 数値型への変換を確実に行う
                 try:
@@ -973,7 +999,7 @@ class ExcelImporter:
             
             # プロセスIDとマッピングを作成
             for row in range(8, last_row + 1):
-                id_value = get_cell_value(schedule_sheet, f"B{row}")
+                id_value = get_cell_value_rc(schedule_sheet, row, 2)
                 if not id_value:
                     continue
                 
@@ -988,7 +1014,7 @@ class ExcelImporter:
                     for phase in project.get_phases():
                         for process in phase.get_processes():
                             # プロセス名がスケジュールシートの名前と一致するか確認
-                            process_name = get_cell_value(schedule_sheet, f"C{row}")
+                            process_name = get_cell_value_rc(schedule_sheet, row, 3)
                             if process.name == process_name:
                                 # マッピングに追加
                                 excel_process_map[id_str] = process
@@ -1005,15 +1031,10 @@ class ExcelImporter:
                 sheet = workbook[excel_process_id]
                 print(f"シート '{excel_process_id}' を処理中...")
                 
-                # タスク名を取得 (B6:B17)
+                # タスク名と状態を取得 (B6:C17)
                 tasks_added = 0
-                for row in range(6, 18):
-                    task_name = get_cell_value(sheet, f"B{row}")
-                    if not task_name:
-                        continue
-                    
+                for task_name, task_status_str in _read_task_rows(sheet):
                     # タスクステータスを取得
-                    task_status_str = get_cell_value(sheet, f"C{row}")
                     task_status = TaskStatus.NOT_STARTED  # デフォルト
                     
                     # ステータス文字列をTaskStatus列挙体に変換
@@ -5,14 +5,232 @@
 import cmd
 import sys
 import os
-import shutil
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from itertools import zip_longest
+from typing import List, Optional, Dict, Any, Tuple, Iterable
 
 from ..core.manager import get_project_manager
 from ..models import ProjectStatus, TaskStatus
 
 
+def _col_widths(headers: List[str], rows: List[List[str]]) -> List[int]:
+    """
+    各列の表示幅を計算
+    
+    Args:
+        headers: 列見出しのリスト
+        rows: 文字列化済みのセルからなる行データのリスト（列数が見出しより少ない行も可）
+        
+    Returns:
+        見出しの各列の最大文字数のリスト
+    """
+    widths = [len(h) for h in headers]
+    for i, col in zip(range(len(widths)), zip_longest(*rows, fillvalue="")):
+        widths[i] = max(widths[i], max(map(len, col)))
+    return widths
+
+
+# project_update で選択番号から状態を引くための対応表
+_PROJ_STATUS_MAP = {
+    "1": ProjectStatus.NOT_STARTED,
+    "2": ProjectStatus.IN_PROGRESS,
+    "3": ProjectStatus.COMPLETED,
+    "4": ProjectStatus.CANCELLED,
+    "5": ProjectStatus.ON_HOLD
+}
+
+# project_update で表示する状態の選択肢
+_PROJ_STATUS_MENU = "\n状態の選択:\n" + "\n".join(
+    f"{key}. {status.value}" for key, status in _PROJ_STATUS_MAP.items()
+)
+
+# task_update で選択番号から状態を引くための対応表
+_TASK_STATUS_CHOICES = {
+    "1": TaskStatus.NOT_STARTED,
+    "2": TaskStatus.IN_PROGRESS,
+    "3": TaskStatus.COMPLETED,
+    "4": TaskStatus.IMPOSSIBLE
+}
+
+# task_update で表示する状態の選択肢
+_TASK_STATUS_MENU = "\n状態の選択:\n" + "\n".join(
+    f"{key}. {status.value}" for key, status in _TASK_STATUS_CHOICES.items()
+) + "\n"
+
+# task_create で状態名から状態を引くための対応表
+_TASK_STATUS_MAP = {
+    "未着手": TaskStatus.NOT_STARTED,
+    "進行中": TaskStatus.IN_PROGRESS,
+    "完了": TaskStatus.COMPLETED,
+    "対応不能": TaskStatus.IMPOSSIBLE
+}
+
+# 一覧に表示する省略IDの長さ
+_SHORT_ID_LENGTH = 8
+
+
+def _find_child(parent, entity_id: str):
+    """
+    子エンティティをIDで検索
+    
+    完全なIDは親の索引で引き、一覧に表示される先頭8文字は親の子だけを走査して照合する
+    
+    Args:
+        parent: 検索対象の親エンティティ
+        entity_id: 子エンティティのID、または先頭8文字
+        
+    Returns:
+        見つかった子エンティティ、存在しないか先頭8文字が重複する場合はNone
+    """
+    child = parent.find_child(entity_id)
+    if child is not None or len(entity_id) != _SHORT_ID_LENGTH:
+        return child
+    
+    matches = [child for child in parent.children if child.id[:_SHORT_ID_LENGTH] == entity_id]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _short_id(entity_id: str) -> str:
+    """
+    一覧表示用に短縮したIDを取得
+    
+    Args:
+        entity_id: エンティティのID
+        
+    Returns:
+        先頭8文字に省略記号を付けた文字列
+    """
+    return f"{entity_id[:_SHORT_ID_LENGTH]}..."
+
+
+def _split_n(text: str, n: int) -> Tuple[Optional[str], ...]:
+    """
+    文字列を空白1文字で最大n個に分割
+    
+    str.split(" ", n - 1) と同じ区切り方をするが、常に長さnのタプルを返す。
+    
+    Args:
+        text: 分割する文字列
+        n: 取り出す項目数（最後の項目に残りの文字列がすべて入る）
+        
+    Returns:
+        分割結果のタプル、足りない項目はNone
+    """
+    fields = []
+    pos = 0
+    find = text.find
+    for _ in range(n - 1):
+        end = find(" ", pos)
+        if end < 0:
+            break
+        fields.append(text[pos:end])
+        pos = end + 1
+    fields.append(text[pos:])
+    fields.extend([None] * (n - len(fields)))
+    return tuple(fields)
+
+
+@lru_cache(maxsize=256)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    YYYY-MM-DD形式の日付文字列を解析（datetimeは不変なので結果を再利用する）
+    
+    Args:
+        date_str: 日付文字列
+        
+    Returns:
+        解析された日付、無効な場合はNone
+    """
+    # YYYY-MM-DD形式は書式解釈を行わずに直接数値化する
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            pass
+    
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _ask(prompt: str) -> str:
+    """
+    プロンプトを表示して1行の入力を受け付ける
+    
+    標準入力が端末の場合は input() を使い、行編集機能をそのまま利用する。
+    パイプやリダイレクトの場合は readline の初期化を経由せずに直接読み込む。
+    
+    Args:
+        prompt: 表示するプロンプト
+        
+    Returns:
+        前後の空白を除去した入力文字列
+    """
+    if sys.stdin.isatty():
+        return input(prompt).strip()
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
+
+
+# 端末の幅を再取得するまでのコマンド数
+_TERMINAL_WIDTH_TTL = 16
+
+# 端末の幅を取得できない場合の既定値
+_DEFAULT_TERMINAL_WIDTH = 80
+
+# 一覧表示での数値列の書式
+_PERCENT_FMT = "%.1f%%"
+_HOURS_FMT = "%.1fh"
+
+# _print_table が一度に出力する行数
+_TABLE_CHUNK_ROWS = 100
+
+# 日時の表示書式
+_TS_FMT = "%Y-%m-%d %H:%M"
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """
+    ISO形式の日時文字列を表示用に整形
+    
+    Args:
+        timestamp: ISO形式の日時文字列
+        
+    Returns:
+        "YYYY-MM-DD HH:MM" 形式の文字列
+    """
+    # isoformat() の出力は固定幅なので datetime を生成せずに切り出す
+    if len(timestamp) >= 16 and timestamp[10] == "T":
+        return f"{timestamp[:10]} {timestamp[11:16]}"
+    return datetime.fromisoformat(timestamp).strftime(_TS_FMT)
+
+
+# (文字, 幅) ごとに生成済みの区切り線
+_separator_cache: Dict[Tuple[str, int], str] = {}
+
+
+def _separator(char: str, width: int) -> str:
+    """
+    区切り線を取得（同じ幅の区切り線は再生成しない）
+    
+    Args:
+        char: 区切り線に使う文字
+        width: 区切り線の幅
+        
+    Returns:
+        区切り線の文字列
+    """
+    key = (char, width)
+    line = _separator_cache.get(key)
+    if line is None:
+        line = _separator_cache[key] = char * width
+    return line
+
+
 class ProjectManagerCLI(cmd.Cmd):
     """
     プロジェクト管理システムのコマンドラインインターフェース
@@ -34,8 +252,42 @@ quit または exit で終了します
         super().__init__()
         self.manager = get_project_manager()
         
-        # 端末の幅を取得
-        self.terminal_width = shutil.get_terminal_size().columns
+        # 端末の幅（表示が必要になった時点で取得し、一定コマンド数ごとに再取得）
+        self._terminal_width: Optional[int] = None
+        self._tw_ttl = 0
+    
+    @property
+    def terminal_width(self) -> int:
+        """
+        端末の幅を取得
+        
+        取得した値は _TERMINAL_WIDTH_TTL コマンドの間再利用し、
+        その後は端末サイズの変更に追従するため再取得する。
+        
+        Returns:
+            端末の列数
+        """
+        if self._terminal_width is None or self._tw_ttl <= 0:
+            try:
+                self._terminal_width = os.get_terminal_size(sys.stdout.fileno()).columns
+            except (AttributeError, ValueError, OSError):
+                # 端末に接続されていない場合
+                self._terminal_width = _DEFAULT_TERMINAL_WIDTH
+            self._tw_ttl = _TERMINAL_WIDTH_TTL
+        return self._terminal_width
+    
+    def precmd(self, line: str) -> str:
+        """
+        コマンド実行前の処理
+        
+        Args:
+            line: 入力されたコマンド行
+            
+        Returns:
+            実行するコマンド行
+        """
+        self._tw_ttl -= 1
+        return line
     
     # ===== ユーティリティメソッド =====
     
@@ -46,37 +298,42 @@ quit または exit で終了します
         Args:
             title: 見出しタイトル
         """
-        print("\n" + "=" * self.terminal_width)
+        width = self.terminal_width
+        print("\n" + _separator("=", width))
         print(f"{title}")
-        print("-" * self.terminal_width)
+        print(_separator("-", width))
     
-    def _print_table(self, headers: List[str], rows: List[List[str]]) -> None:
+    def _print_table(self, headers: List[str], rows: Iterable[List[Any]]) -> None:
         """
         表形式でデータを表示
         
         Args:
             headers: 列見出しのリスト
-            rows: 行データのリスト
+            rows: 行データのリスト、または行を順に返すイテラブル
         """
-        if not rows:
+        # セルを一度だけ文字列化しておく（ジェネレータもここで一度だけ走査する）
+        str_rows = [[cell if isinstance(cell, str) else str(cell) for cell in row] for row in rows]
+        
+        if not str_rows:
             print("データがありません")
             return
         
         # 各列の幅を計算
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+        col_widths = _col_widths(headers, str_rows)
         
         # ヘッダーを表示
         header_line = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
         print(header_line)
-        print("-" * len(header_line))
-        
-        # データ行を表示
-        for row in rows:
-            row_line = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            print(row_line)
+        print(_separator("-", len(header_line)))
+        
+        # データ行を一定行数ごとにまとめて出力
+        write = sys.stdout.write
+        for start in range(0, len(str_rows), _TABLE_CHUNK_ROWS):
+            chunk = str_rows[start:start + _TABLE_CHUNK_ROWS]
+            write("\n".join(
+                " | ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(row))
+                for row in chunk
+            ) + "\n")
     
     def _format_date(self, date_str: Optional[str]) -> str:
         """
@@ -91,10 +348,14 @@ quit または exit で終了します
         if not date_str:
             return "未設定"
         
+        # ISO形式（YYYY-MM-DD...）であれば日付部分をそのまま切り出す
+        if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+            return date_str[:10]
+        
         try:
             date = datetime.fromisoformat(date_str)
             return date.strftime("%Y-%m-%d")
-        except:
+        except (TypeError, ValueError):
             return date_str
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
@@ -107,11 +368,10 @@ quit または exit で終了します
         Returns:
             解析された日付、無効な場合はNone
         """
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+        date = _parse_date_cached(date_str)
+        if date is None:
             print(f"無効な日付形式です: {date_str} (YYYY-MM-DD形式を使用してください)")
-            return None
+        return date
     
     def _get_entity_path(self) -> str:
         """
@@ -130,6 +390,102 @@ quit または exit で終了します
         path = self._get_entity_path()
         self.prompt = f"(PM {path}) > "
     
+    def _parse_three_ids(self, arg: str) -> Optional[List[str]]:
+        """
+        フェーズID・プロセスID・タスクIDの3引数を解析
+        
+        Args:
+            arg: コマンド引数の文字列
+            
+        Returns:
+            [フェーズID, プロセスID, タスクID]、不足している場合はNone
+        """
+        parts = arg.split(None, 2)
+        return parts if len(parts) == 3 else None
+    
+    def _resolve(self, phase_id: str, process_id: str, task_id: str):
+        """
+        フェーズ・プロセス・タスクをまとめて検索
+        
+        見つからない場合は、どの階層が見つからないかを表示する
+        
+        Args:
+            phase_id: フェーズのID、または先頭8文字
+            process_id: プロセスのID、または先頭8文字
+            task_id: タスクのID
+            
+        Returns:
+            (フェーズ, プロセス, タスク)、見つからない場合はNone
+        """
+        resolved = self.manager.resolve_task(phase_id, process_id, task_id)
+        if resolved is not None:
+            return resolved
+        
+        # 省略IDでの指定や、どの階層が見つからないかの判定は段階的に検索する
+        phase = self._find_phase(phase_id)
+        if not phase:
+            print(f"フェーズ ID '{phase_id}' が見つかりません")
+            return None
+        
+        process = self._find_process(phase, process_id)
+        if not process:
+            print(f"プロセス ID '{process_id}' が見つかりません")
+            return None
+        
+        task = process.find_task(task_id)
+        if not task:
+            print(f"タスク ID '{task_id}' が見つかりません")
+            return None
+        
+        return phase, process, task
+    
+    def _find_phase(self, phase_id: str):
+        """
+        現在のプロジェクトからフェーズを検索
+        
+        Args:
+            phase_id: フェーズのID、または一覧に表示される先頭8文字
+            
+        Returns:
+            見つかったフェーズ、存在しない場合はNone
+        """
+        project = self.manager.current_project
+        return _find_child(project, phase_id) if project else None
+    
+    def _find_process(self, phase, process_id: str):
+        """
+        フェーズからプロセスを検索
+        
+        Args:
+            phase: プロセスが属するフェーズ
+            process_id: プロセスのID、または一覧に表示される先頭8文字
+            
+        Returns:
+            見つかったプロセス、存在しない場合はNone
+        """
+        return _find_child(phase, process_id)
+    
+    def _batch_input(self, fields: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        複数項目の入力をまとめて受け付ける
+        
+        標準入力が端末でない場合（パイプやリダイレクト）は、項目数分の行を
+        バッファ済みの標準入力から続けて読み込む。
+        
+        Args:
+            fields: (キー, プロンプト) のタプルのリスト
+            
+        Returns:
+            キーと入力値（前後の空白を除去）の辞書
+        """
+        if sys.stdin.isatty():
+            return {key: _ask(prompt) for key, prompt in fields}
+        
+        sys.stdout.write("".join(prompt for _, prompt in fields))
+        sys.stdout.flush()
+        readline = sys.stdin.readline
+        return {key: readline().strip() for key, _ in fields}
+    
     # ===== コマンド実装 =====
     
     def do_quit(self, arg: str) -> bool:
@@ -161,35 +517,8 @@ quit または exit で終了します
         else:
             # カテゴリー別にコマンドを整理して表示
             self._print_header("利用可能なコマンド")
-            
-            command_categories = {
-                "プロジェクト操作": [
-                    "project_list", "project_create", "project_load", 
-                    "project_info", "project_update", "project_delete"
-                ],
-                "フェーズ操作": [
-                    "phase_list", "phase_create", "phase_info", 
-                    "phase_update", "phase_delete"
-                ],
-                "プロセス操作": [
-                    "process_list", "process_create", "process_info", 
-                    "process_update", "process_delete"
-                ],
-                "タスク操作": [
-                    "task_list", "task_create", "task_info", 
-                    "task_update", "task_delete"
-                ],
-                "その他": [
-                    "help", "quit", "exit"
-                ]
-            }
-            
-            for category, commands in command_categories.items():
-                print(f"\n{category}:")
-                for cmd_name in commands:
-                    cmd_func = getattr(self, f"do_{cmd_name}")
-                    cmd_doc = cmd_func.__doc__.split("\n")[0] if cmd_func.__doc__ else ""
-                    print(f"  {cmd_name.ljust(15)} - {cmd_doc}")
+            sys.stdout.write(_HELP_BLOCK)
+            sys.stdout.write("\n")
     
     # ===== プロジェクト操作 =====
     
@@ -208,16 +537,17 @@ quit または exit で終了します
             return
         
         headers = ["ID", "名前", "状態", "進捗率", "更新日時"]
-        rows = []
-        
-        for project in projects:
-            rows.append([
-                project["id"][:8] + "...",  # IDは短く表示
+        progress_texts = map(_PERCENT_FMT.__mod__, [project["progress"] for project in projects])
+        rows = (
+            [
+                _short_id(project["id"]),
                 project["name"],
                 project["status"],
-                f"{project['progress']:.1f}%",
-                datetime.fromisoformat(project["updated_at"]).strftime("%Y-%m-%d %H:%M")
-            ])
+                progress_text,
+                _format_timestamp(project["updated_at"])
+            ]
+            for project, progress_text in zip(projects, progress_texts)
+        )
         
         self._print_table(headers, rows)
     
@@ -286,8 +616,8 @@ quit または exit で終了します
         
         print(f"開始日: {start_date.strftime('%Y-%m-%d') if start_date else '未設定'}")
         print(f"終了日: {end_date.strftime('%Y-%m-%d') if end_date else '未設定'}")
-        print(f"作成日時: {project.created_at.strftime('%Y-%m-%d %H:%M')}")
-        print(f"更新日時: {project.updated_at.strftime('%Y-%m-%d %H:%M')}")
+        print(f"作成日時: {project.created_at.strftime(_TS_FMT)}")
+        print(f"更新日時: {project.updated_at.strftime(_TS_FMT)}")
         
         phases = project.get_phases()
         print(f"\nフェーズ数: {len(phases)}")
@@ -317,24 +647,11 @@ quit または exit で終了します
         print(f"現在の状態: {current.status.value}")
         
         # 新しい値を入力
-        name = input("新しい名前: ").strip()
-        description = input("新しい説明: ").strip()
-        
-        status_map = {
-            "1": ProjectStatus.NOT_STARTED,
-            "2": ProjectStatus.IN_PROGRESS,
-            "3": ProjectStatus.COMPLETED,
-            "4": ProjectStatus.CANCELLED,
-            "5": ProjectStatus.ON_HOLD
-        }
+        name = _ask("新しい名前: ")
+        description = _ask("新しい説明: ")
         
-        print("\n状態の選択:")
-        print("1. 未着手")
-        print("2. 進行中")
-        print("3. 完了")
-        print("4. 中止")
-        print("5. 保留")
-        status_input = input("選択 (1-5): ").strip()
+        print(_PROJ_STATUS_MENU)
+        status_input = _ask("選択 (1-5): ")
         
         # パラメータを準備
         update_params = {}
@@ -342,8 +659,8 @@ quit または exit で終了します
             update_params["name"] = name
         if description:
             update_params["description"] = description
-        if status_input in status_map:
-            update_params["status"] = status_map[status_input]
+        if status_input in _PROJ_STATUS_MAP:
+            update_params["status"] = _PROJ_STATUS_MAP[status_input]
         
         # 更新実行
         if update_params:
@@ -367,7 +684,7 @@ quit または exit で終了します
             return
         
         # 削除の確認
-        confirm = input(f"プロジェクト ID '{arg}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
+        confirm = _ask(f"プロジェクト ID '{arg}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
         if confirm.lower() != 'y':
             print("削除をキャンセルしました")
             return
@@ -402,17 +719,18 @@ quit または exit で終了します
             return
         
         headers = ["ID", "名前", "進捗率", "開始日", "終了日", "プロセス数"]
-        rows = []
-        
-        for phase in phases:
-            rows.append([
-                phase["id"][:8] + "...",  # IDは短く表示
+        progress_texts = map(_PERCENT_FMT.__mod__, [phase["progress"] for phase in phases])
+        rows = (
+            [
+                _short_id(phase["id"]),
                 phase["name"],
-                f"{phase['progress']:.1f}%",
+                progress_text,
                 self._format_date(phase["start_date"]),
                 self._format_date(phase["end_date"]),
                 phase["process_count"]
-            ])
+            ]
+            for phase, progress_text in zip(phases, progress_texts)
+        )
         
         self._print_table(headers, rows)
     
@@ -458,7 +776,7 @@ quit または exit で終了します
             print("Usage: phase_info <フェーズID>")
             return
         
-        phase = self.manager.current_project.find_phase(arg)
+        phase = self._find_phase(arg)
         
         if not phase:
             print(f"フェーズ ID '{arg}' が見つかりません")
@@ -475,8 +793,8 @@ quit または exit で終了します
         
         print(f"開始日: {start_date.strftime('%Y-%m-%d') if start_date else '未設定'}")
         print(f"終了日: {end_date.strftime('%Y-%m-%d') if end_date else '未設定'}")
-        print(f"作成日時: {phase.created_at.strftime('%Y-%m-%d %H:%M')}")
-        print(f"更新日時: {phase.updated_at.strftime('%Y-%m-%d %H:%M')}")
+        print(f"作成日時: {phase.created_at.strftime(_TS_FMT)}")
+        print(f"更新日時: {phase.updated_at.strftime(_TS_FMT)}")
         
         processes = phase.get_processes()
         print(f"\nプロセス数: {len(processes)}")
@@ -501,7 +819,7 @@ quit または exit で終了します
             print("Usage: phase_update <フェーズID>")
             return
         
-        phase = self.manager.current_project.find_phase(arg)
+        phase = self._find_phase(arg)
         
         if not phase:
             print(f"フェーズ ID '{arg}' が見つかりません")
@@ -516,13 +834,13 @@ quit または exit で終了します
         print(f"現在の終了日: {end_date.strftime('%Y-%m-%d') if end_date else '未設定'}")
         
         # 新しい値を入力
-        name = input("新しい名前: ").strip()
-        description = input("新しい説明: ").strip()
-        end_date_str = input("新しい終了日 (YYYY-MM-DD): ").strip()
+        name = _ask("新しい名前: ")
+        description = _ask("新しい説明: ")
+        end_date_str = _ask("新しい終了日 (YYYY-MM-DD): ")
         
         # パラメータを準備
         update_params = {
-            "phase_id": arg
+            "phase_id": phase.id
         }
         
         if name:
@@ -558,19 +876,19 @@ quit または exit で終了します
             print("Usage: phase_delete <フェーズID>")
             return
         
-        phase = self.manager.current_project.find_phase(arg)
+        phase = self._find_phase(arg)
         
         if not phase:
             print(f"フェーズ ID '{arg}' が見つかりません")
             return
         
         # 削除の確認
-        confirm = input(f"フェーズ '{phase.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
+        confirm = _ask(f"フェーズ '{phase.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
         if confirm.lower() != 'y':
             print("削除をキャンセルしました")
             return
         
-        if self.manager.remove_phase(arg):
+        if self.manager.remove_phase(phase.id):
             print(f"フェーズ '{phase.name}' を削除しました")
         else:
             print(f"フェーズ ID '{arg}' の削除に失敗しました")
@@ -592,13 +910,13 @@ quit または exit で終了します
             print("Usage: process_list <フェーズID>")
             return
         
-        phase = self.manager.current_project.find_phase(arg)
+        phase = self._find_phase(arg)
         
         if not phase:
             print(f"フェーズ ID '{arg}' が見つかりません")
             return
         
-        processes = self.manager.get_processes(arg)
+        processes = self.manager.get_processes(phase.id)
         
         self._print_header(f"フェーズ '{phase.name}' のプロセス一覧")
         
@@ -607,20 +925,25 @@ quit または exit で終了します
             return
         
         headers = ["ID", "名前", "担当者", "進捗率", "開始日", "終了日", "予想工数", "実工数", "タスク数"]
-        rows = []
-        
-        for process in processes:
-            rows.append([
-                process["id"][:8] + "...",  # IDは短く表示
+        # 数値列は列ごとにまとめて書式化する
+        progress_texts = map(_PERCENT_FMT.__mod__, [process["progress"] for process in processes])
+        estimated_texts = map(_HOURS_FMT.__mod__, [process["estimated_hours"] for process in processes])
+        actual_texts = map(_HOURS_FMT.__mod__, [process["actual_hours"] for process in processes])
+        rows = (
+            [
+                _short_id(process["id"]),
                 process["name"],
                 process["assignee"] or "未割当",
-                f"{process['progress']:.1f}%",
+                progress_text,
                 self._format_date(process["start_date"]),
                 self._format_date(process["end_date"]),
-                f"{process['estimated_hours']:.1f}h",
-                f"{process['actual_hours']:.1f}h",
+                estimated_text,
+                actual_text,
                 process["task_count"]
-            ])
+            ]
+            for process, progress_text, estimated_text, actual_text
+            in zip(processes, progress_texts, estimated_texts, actual_texts)
+        )
         
         self._print_table(headers, rows)
     
@@ -634,25 +957,23 @@ quit または exit で終了します
             print("プロジェクトが読み込まれていません")
             return
         
-        args = arg.split(" ", 3)
+        phase_id, name, description, assignee = _split_n(arg, 4)
         
-        if len(args) < 2 or not args[0] or not args[1]:
+        if not phase_id or not name:
             print("フェーズIDとプロセス名を指定してください")
             print("Usage: process_create <フェーズID> <名前> [説明] [担当者]")
             return
         
-        phase_id = args[0]
-        name = args[1]
-        description = args[2] if len(args) > 2 else ""
-        assignee = args[3] if len(args) > 3 else ""
+        description = description or ""
+        assignee = assignee or ""
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = self.manager.add_process(phase_id, name, description, assignee)
+        process = self.manager.add_process(phase.id, name, description, assignee)
         
         if process:
             print(f"プロセス '{name}' を作成しました (ID: {process.id})")
@@ -679,13 +1000,13 @@ quit または exit で終了します
         phase_id = args[0]
         process_id = args[1]
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = phase.find_process(process_id)
+        process = self._find_process(phase, process_id)
         
         if not process:
             print(f"プロセス ID '{process_id}' が見つかりません")
@@ -705,8 +1026,8 @@ quit または exit で終了します
         print(f"終了日: {end_date.strftime('%Y-%m-%d') if end_date else '未設定'}")
         print(f"予想工数: {process.estimated_hours:.1f}h")
         print(f"実工数: {process.actual_hours:.1f}h")
-        print(f"作成日時: {process.created_at.strftime('%Y-%m-%d %H:%M')}")
-        print(f"更新日時: {process.updated_at.strftime('%Y-%m-%d %H:%M')}")
+        print(f"作成日時: {process.created_at.strftime(_TS_FMT)}")
+        print(f"更新日時: {process.updated_at.strftime(_TS_FMT)}")
         
         tasks = process.get_tasks()
         print(f"\nタスク数: {len(tasks)}")
@@ -736,13 +1057,13 @@ quit または exit で終了します
         phase_id = args[0]
         process_id = args[1]
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = phase.find_process(process_id)
+        process = self._find_process(phase, process_id)
         
         if not process:
             print(f"プロセス ID '{process_id}' が見つかりません")
@@ -762,18 +1083,27 @@ quit または exit で終了します
         print(f"現在の実工数: {process.actual_hours:.1f}h")
         
         # 新しい値を入力
-        name = input("新しい名前: ").strip()
-        description = input("新しい説明: ").strip()
-        assignee = input("新しい担当者: ").strip()
-        start_date_str = input("新しい開始日 (YYYY-MM-DD): ").strip()
-        end_date_str = input("新しい終了日 (YYYY-MM-DD): ").strip()
-        estimated_hours_str = input("新しい予想工数 (時間): ").strip()
-        actual_hours_str = input("新しい実工数 (時間): ").strip()
+        values = self._batch_input([
+            ("name", "新しい名前: "),
+            ("description", "新しい説明: "),
+            ("assignee", "新しい担当者: "),
+            ("start_date", "新しい開始日 (YYYY-MM-DD): "),
+            ("end_date", "新しい終了日 (YYYY-MM-DD): "),
+            ("estimated_hours", "新しい予想工数 (時間): "),
+            ("actual_hours", "新しい実工数 (時間): ")
+        ])
+        name = values["name"]
+        description = values["description"]
+        assignee = values["assignee"]
+        start_date_str = values["start_date"]
+        end_date_str = values["end_date"]
+        estimated_hours_str = values["estimated_hours"]
+        actual_hours_str = values["actual_hours"]
         
         # パラメータを準備
         update_params = {
-            "phase_id": phase_id,
-            "process_id": process_id
+            "phase_id": phase.id,
+            "process_id": process.id
         }
         
         if name:
@@ -832,25 +1162,25 @@ quit または exit で終了します
         phase_id = args[0]
         process_id = args[1]
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = phase.find_process(process_id)
+        process = self._find_process(phase, process_id)
         
         if not process:
             print(f"プロセス ID '{process_id}' が見つかりません")
             return
         
         # 削除の確認
-        confirm = input(f"プロセス '{process.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
+        confirm = _ask(f"プロセス '{process.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
         if confirm.lower() != 'y':
             print("削除をキャンセルしました")
             return
         
-        if self.manager.remove_process(phase_id, process_id):
+        if self.manager.remove_process(phase.id, process.id):
             print(f"プロセス '{process.name}' を削除しました")
         else:
             print(f"プロセス ID '{process_id}' の削除に失敗しました")
@@ -877,19 +1207,19 @@ quit または exit で終了します
         phase_id = args[0]
         process_id = args[1]
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = phase.find_process(process_id)
+        process = self._find_process(phase, process_id)
         
         if not process:
             print(f"プロセス ID '{process_id}' が見つかりません")
             return
         
-        tasks = self.manager.get_tasks(phase_id, process_id)
+        tasks = self.manager.get_tasks(phase.id, process.id)
         
         self._print_header(f"プロセス '{process.name}' のタスク一覧")
         
@@ -898,16 +1228,17 @@ quit または exit で終了します
             return
         
         headers = ["ID", "名前", "状態", "作成日時", "更新日時"]
-        rows = []
-        
-        for task in tasks:
-            rows.append([
-                task["id"][:8] + "...",  # IDは短く表示
+        fromisoformat = datetime.fromisoformat
+        rows = (
+            [
+                _short_id(task["id"]),
                 task["name"],
                 task["status"],
-                datetime.fromisoformat(task["created_at"]).strftime("%Y-%m-%d"),
-                datetime.fromisoformat(task["updated_at"]).strftime("%Y-%m-%d")
-            ])
+                fromisoformat(task["created_at"]).strftime("%Y-%m-%d"),
+                fromisoformat(task["updated_at"]).strftime("%Y-%m-%d")
+            ]
+            for task in tasks
+        )
         
         self._print_table(headers, rows)
     
@@ -922,26 +1253,23 @@ quit または exit で終了します
             print("プロジェクトが読み込まれていません")
             return
         
-        args = arg.split(" ", 4)
+        phase_id, process_id, name, description, status_str = _split_n(arg, 5)
         
-        if len(args) < 3 or not args[0] or not args[1] or not args[2]:
+        if not phase_id or not process_id or not name:
             print("フェーズID、プロセスID、タスク名を指定してください")
             print("Usage: task_create <フェーズID> <プロセスID> <名前> [説明] [状態]")
             return
         
-        phase_id = args[0]
-        process_id = args[1]
-        name = args[2]
-        description = args[3] if len(args) > 3 else ""
-        status_str = args[4] if len(args) > 4 else ""
+        description = description or ""
+        status_str = status_str or ""
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        phase = self._find_phase(phase_id)
         
         if not phase:
             print(f"フェーズ ID '{phase_id}' が見つかりません")
             return
         
-        process = phase.find_process(process_id)
+        process = self._find_process(phase, process_id)
         
         if not process:
             print(f"プロセス ID '{process_id}' が見つかりません")
@@ -950,21 +1278,14 @@ quit または exit で終了します
         status = TaskStatus.NOT_STARTED  # デフォルト値
         
         if status_str:
-            status_map = {
-                "未着手": TaskStatus.NOT_STARTED,
-                "進行中": TaskStatus.IN_PROGRESS,
-                "完了": TaskStatus.COMPLETED,
-                "対応不能": TaskStatus.IMPOSSIBLE
-            }
-            
-            if status_str in status_map:
-                status = status_map[status_str]
+            if status_str in _TASK_STATUS_MAP:
+                status = _TASK_STATUS_MAP[status_str]
             else:
                 print(f"無効な状態です: {status_str}")
                 print("有効な状態: 未着手, 進行中, 完了, 対応不能")
                 return
         
-        task = self.manager.add_task(phase_id, process_id, name, description, status)
+        task = self.manager.add_task(phase.id, process.id, name, description, status)
         
         if task:
             print(f"タスク '{name}' を作成しました (ID: {task.id})")
@@ -981,55 +1302,48 @@ quit または exit で終了します
             print("プロジェクトが読み込まれていません")
             return
         
-        args = arg.split(" ", 2)
+        ids = self._parse_three_ids(arg)
         
-        if len(args) < 3 or not args[0] or not args[1] or not args[2]:
+        if not ids:
             print("フェーズID、プロセスID、タスクIDを指定してください")
             print("Usage: task_info <フェーズID> <プロセスID> <タスクID>")
             return
         
-        phase_id = args[0]
-        process_id = args[1]
-        task_id = args[2]
-        
-        phase = self.manager.current_project.find_phase(phase_id)
-        
-        if not phase:
-            print(f"フェーズ ID '{phase_id}' が見つかりません")
-            return
+        phase_id, process_id, task_id = ids
         
-        process = phase.find_process(process_id)
+        resolved = self._resolve(phase_id, process_id, task_id)
         
-        if not process:
-            print(f"プロセス ID '{process_id}' が見つかりません")
+        if resolved is None:
             return
         
-        task = process.find_task(task_id)
-        
-        if not task:
-            print(f"タスク ID '{task_id}' が見つかりません")
-            return
+        phase, process, task = resolved
         
         self._print_header(f"タスク: {task.name}")
         
-        print(f"ID: {task.id}")
-        print(f"説明: {task.description}")
-        print(f"状態: {task.status.value}")
-        print(f"作成日時: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
-        print(f"更新日時: {task.updated_at.strftime('%Y-%m-%d %H:%M')}")
+        sys.stdout.write(
+            f"ID: {task.id}\n"
+            f"説明: {task.description}\n"
+            f"状態: {task.status.value}\n"
+            f"作成日時: {task.created_at.strftime(_TS_FMT)}\n"
+            f"更新日時: {task.updated_at.strftime(_TS_FMT)}\n"
+        )
         
         # タスクの履歴を表示
         history = self.manager.get_entity_history(task.id)
         
         if history:
-            print("\n変更履歴:")
+            lines = ["\n変更履歴:"]
+            append = lines.append
             for idx, entry in enumerate(history, 1):
-                timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M")
-                print(f"  {idx}. {timestamp} - {entry['action_type']}")
+                timestamp = _format_timestamp(entry["timestamp"])
+                append(f"  {idx}. {timestamp} - {entry['action_type']}")
                 
                 if "details" in entry and "status" in entry["details"]:
                     status_change = entry["details"]["status"]
-                    print(f"     状態変更: {status_change['old']} -> {status_change['new']}")
+                    append(f"     状態変更: {status_change['old']} -> {status_change['new']}")
+            
+            # 履歴が長くても出力は1回の書き込みにまとめる
+            sys.stdout.write("\n".join(lines) + "\n")
     
     def do_task_update(self, arg: str) -> None:
         """
@@ -1041,82 +1355,73 @@ quit または exit で終了します
             print("プロジェクトが読み込まれていません")
             return
         
-        args = arg.split(" ", 2)
+        ids = self._parse_three_ids(arg)
         
-        if len(args) < 3 or not args[0] or not args[1] or not args[2]:
+        if not ids:
             print("フェーズID、プロセスID、タスクIDを指定してください")
             print("Usage: task_update <フェーズID> <プロセスID> <タスクID>")
             return
         
-        phase_id = args[0]
-        process_id = args[1]
-        task_id = args[2]
+        phase_id, process_id, task_id = ids
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        resolved = self._resolve(phase_id, process_id, task_id)
         
-        if not phase:
-            print(f"フェーズ ID '{phase_id}' が見つかりません")
+        if resolved is None:
             return
         
-        process = phase.find_process(process_id)
+        phase, process, task = resolved
         
-        if not process:
-            print(f"プロセス ID '{process_id}' が見つかりません")
-            return
-        
-        task = process.find_task(task_id)
-        
-        if not task:
-            print(f"タスク ID '{task_id}' が見つかりません")
-            return
-        
-        print("タスクの更新（変更しない項目は空欄で Enter）")
+        # 入力待ちの間に他のプロセス（GUIなど）が保存していないかを確認するため更新日時を控えておく
+        snapshot_updated_at = task.updated_at
         
         # 現在の値を表示
-        print(f"現在の名前: {task.name}")
-        print(f"現在の説明: {task.description}")
-        print(f"現在の状態: {task.status.value}")
+        sys.stdout.write(
+            "タスクの更新（変更しない項目は空欄で Enter）\n"
+            f"現在の名前: {task.name}\n"
+            f"現在の説明: {task.description}\n"
+            f"現在の状態: {task.status.value}\n"
+        )
         
         # 新しい値を入力
-        name = input("新しい名前: ").strip()
-        description = input("新しい説明: ").strip()
-        
-        status_map = {
-            "1": TaskStatus.NOT_STARTED,
-            "2": TaskStatus.IN_PROGRESS,
-            "3": TaskStatus.COMPLETED,
-            "4": TaskStatus.IMPOSSIBLE
-        }
+        name = _ask("新しい名前: ")
+        description = _ask("新しい説明: ")
         
-        print("\n状態の選択:")
-        print("1. 未着手")
-        print("2. 進行中")
-        print("3. 完了")
-        print("4. 対応不能")
-        status_input = input("選択 (1-4): ").strip()
+        sys.stdout.write(_TASK_STATUS_MENU)
+        status_input = _ask("選択 (1-4): ")
         
-        # パラメータを準備
-        update_params = {
-            "phase_id": phase_id,
-            "process_id": process_id,
-            "task_id": task_id
-        }
+        # パラメータを準備（現在の値と異なる項目だけを変更扱いにする）
+        update_params = {}
+        changed = set()
         
-        if name:
+        if name and name != task.name:
             update_params["name"] = name
-        if description:
+            changed.add("name")
+        if description and description != task.description:
             update_params["description"] = description
-        if status_input in status_map:
-            update_params["status"] = status_map[status_input]
+            changed.add("description")
+        status = _TASK_STATUS_CHOICES.get(status_input)
+        if status is not None and status != task.status:
+            update_params["status"] = status
+            changed.add("status")
+        
+        if not changed:
+            print("変更はありませんでした")
+            return
+        
+        # 入力中に保存済みファイル上で削除・更新されていた場合は上書きしない
+        saved_task = self.manager.load_saved_task(phase.id, process.id, task.id)
+        if saved_task is None:
+            print("入力中にタスクが削除されたため、更新を中止しました")
+            return
+        if saved_task.updated_at != snapshot_updated_at:
+            print("入力中にタスクが更新されたため、更新を中止しました")
+            return
         
         # 更新実行
-        if len(update_params) > 3:  # 必須パラメータ以外のパラメータがある場合
-            if self.manager.update_task(**update_params):
-                print("タスクを更新しました")
-            else:
-                print("タスクの更新に失敗しました")
+        if self.manager.update_task(phase.id, process.id, task.id, changed_fields=changed, **update_params):
+            print("タスクを更新しました")
         else:
-            print("変更はありませんでした")
+            print("タスクの更新に失敗しました")
     
     def do_task_delete(self, arg: str) -> None:
         """
@@ -1128,47 +1433,81 @@ quit または exit で終了します
             print("プロジェクトが読み込まれていません")
             return
         
-        args = arg.split(" ", 2)
+        ids = self._parse_three_ids(arg)
         
-        if len(args) < 3 or not args[0] or not args[1] or not args[2]:
+        if not ids:
             print("フェーズID、プロセスID、タスクIDを指定してください")
             print("Usage: task_delete <フェーズID> <プロセスID> <タスクID>")
             return
         
-        phase_id = args[0]
-        process_id = args[1]
-        task_id = args[2]
+        phase_id, process_id, task_id = ids
         
-        phase = self.manager.current_project.find_phase(phase_id)
+        resolved = self._resolve(phase_id, process_id, task_id)
         
-        if not phase:
-            print(f"フェーズ ID '{phase_id}' が見つかりません")
+        if resolved is None:
             return
         
-        process = phase.find_process(process_id)
-        
-        if not process:
-            print(f"プロセス ID '{process_id}' が見つかりません")
-            return
-        
-        task = process.find_task(task_id)
-        
-        if not task:
-            print(f"タスク ID '{task_id}' が見つかりません")
-            return
+        phase, process, task = resolved
         
         # 削除の確認
-        confirm = input(f"タスク '{task.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
+        confirm = _ask(f"タスク '{task.name}' を削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
         if confirm.lower() != 'y':
             print("削除をキャンセルしました")
             return
         
-        if self.manager.remove_task(phase_id, process_id, task_id):
+        if self.manager.remove_task(phase.id, process.id, task.id):
             print(f"タスク '{task.name}' を削除しました")
         else:
             print(f"タスク ID '{task_id}' の削除に失敗しました")
 
 
+# help で表示するコマンドのカテゴリー
+_COMMAND_CATEGORIES = {
+    "プロジェクト操作": [
+        "project_list", "project_create", "project_load", 
+        "project_info", "project_update", "project_delete"
+    ],
+    "フェーズ操作": [
+        "phase_list", "phase_create", "phase_info", 
+        "phase_update", "phase_delete"
+    ],
+    "プロセス操作": [
+        "process_list", "process_create", "process_info", 
+        "process_update", "process_delete"
+    ],
+    "タスク操作": [
+        "task_list", "task_create", "task_info", 
+        "task_update", "task_delete"
+    ],
+    "その他": [
+        "help", "quit", "exit"
+    ]
+}
+
+
+def _doc_summary(cmd_name: str) -> str:
+    """
+    コマンドのdocstringから概要（最初の空でない行）を取得
+    
+    Args:
+        cmd_name: コマンド名
+        
+    Returns:
+        コマンドの概要、docstringがない場合は空文字列
+    """
+    doc = getattr(ProjectManagerCLI, f"do_{cmd_name}").__doc__ or ""
+    return next((line.strip() for line in doc.splitlines() if line.strip()), "")
+
+
+# help で表示するコマンド一覧（モジュール読み込み時に一度だけ組み立てる）
+_HELP_BLOCK = "\n".join(
+    f"\n{category}:\n" + "\n".join(
+        f"  {cmd_name.ljust(15)} - {_doc_summary(cmd_name)}" for cmd_name in commands
+    )
+    for category, commands in _COMMAND_CATEGORIES.items()
+)
+
+
 def run_cli():
     """
     CLIを実行
@@ -1,10 +1,29 @@
 """
 GUIパッケージの初期化
 グラフィカルユーザーインターフェース機能をインポートして外部に公開
+
+PyQt6 の読み込みは重いため、実際にGUIを使うまでインポートを遅延する
 """
-from .app import ProjectManagerGUI, run_gui
 
 __all__ = [
     'ProjectManagerGUI',
     'run_gui'
 ]
+
+
+def run_gui(*args, **kwargs):
+    """
+    GUIを実行（初回呼び出し時に PyQt6 を読み込む）
+    
+    Returns:
+        終了コード
+    """
+    from .app import run_gui as _run_gui
+    return _run_gui(*args, **kwargs)
+
+
+def __getattr__(name):
+    if name == 'ProjectManagerGUI':
+        from .app import ProjectManagerGUI
+        return ProjectManagerGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,11 +3,6 @@ GUIアプリケーション
 プロジェクト管理システムのGUIインターフェースのメインアプリケーション
 """
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-
-from .main_window import MainWindow
-from .controller import GUIController
 
 
 class ProjectManagerGUI:
@@ -17,9 +12,17 @@ class ProjectManagerGUI:
     
     def __init__(self):
         """GUIアプリケーションの初期化"""
-        # QApplicationの作成（既存の場合は再利用）
-        self.app = QApplication.instance() or QApplication(sys.argv)
-        self.app.setApplicationName("プロジェクト管理システム")
+        # PyQt6 関連はGUI起動時に初めて読み込む
+        from PyQt6.QtWidgets import QApplication
+        from .main_window import MainWindow
+        from .controller import GUIController
+        
+        # QApplicationの作成（既存の場合は再利用し、名前の再設定もしない）
+        app = QApplication.instance()
+        if app is None:
+            app = QApplication(sys.argv)
+            app.setApplicationName("プロジェクト管理システム")
+        self.app = app
         
         # GUIコントローラーの作成
         self.controller = GUIController()
@@ -2,19 +2,150 @@
 Excel一括インポートダイアログ
 複数のExcelファイルを一括でインポートするためのダイアログ
 """
+import os
+from contextlib import nullcontext
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QRadioButton, QButtonGroup, QGroupBox,
     QMessageBox, QComboBox, QCheckBox, QListWidget, QListWidgetItem,
-    QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QProgressBar,
+    QTableView, QHeaderView, QSplitter, QProgressBar,
     QTextEdit
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QSize, QObject, QThread, QAbstractTableModel, QModelIndex, QSettings, pyqtSignal
+)
+from PyQt6.QtGui import QBrush
 
-# 相対パスを使用する場合
-from ...excel.bulk_excel_importer import BulkExcelImporter
 from ...core.manager import get_project_manager
 
+# この行数を超える結果では resizeColumnsToContents を使わず固定幅にする
+_RESIZE_ROW_LIMIT = 200
+_FIXED_COLUMN_WIDTHS = (220, 140, 60, 200)
+
+# 前回選択したディレクトリを保存する設定キー
+_LAST_DIR_KEY = "bulk_import/last_dir"
+
+
+class BulkImportWorker(QObject):
+    """
+    一括インポートをバックグラウンドスレッドで実行するワーカー
+    """
+    
+    progress = pyqtSignal(int, int, str)  # 処理済み件数, 総件数, ファイル名
+    finished = pyqtSignal(dict)  # インポート結果
+    
+    def __init__(self, importer, directory_path: str):
+        """
+        ワーカーの初期化
+        
+        Args:
+            importer: 使用する一括インポーター（BulkExcelImporter）
+            directory_path: インポート対象ディレクトリ
+        """
+        super().__init__()
+        
+        self.importer = importer
+        self.directory_path = directory_path
+    
+    def run(self):
+        """インポートを実行し、完了時に結果を通知"""
+        try:
+            results = self.importer.bulk_import_from_directory(
+                self.directory_path, progress_callback=self.progress.emit
+            )
+        except Exception as e:
+            results = {
+                "success_count": 0,
+                "fail_count": 0,
+                "details": [],
+                "projects": [],
+                "error": str(e)
+            }
+        
+        self.finished.emit(results)
+
+
+class ImportResultModel(QAbstractTableModel):
+    """
+    一括インポート結果の詳細リストをそのまま表示するテーブルモデル
+    """
+    
+    HEADERS = ["ファイル名", "サブディレクトリ", "状態", "プロジェクト名", "詳細"]
+    STATUS_COLUMN = 2
+    
+    def __init__(self, details=None, parent=None):
+        """
+        モデルの初期化
+        
+        Args:
+            details: インポート結果の詳細リスト
+            parent: 親オブジェクト
+        """
+        super().__init__(parent)
+        
+        self._details = details or []
+        
+        # 状態ごとの文字色ブラシ
+        green = QBrush(Qt.GlobalColor.darkGreen)
+        red = QBrush(Qt.GlobalColor.red)
+        self._status_brushes = {"成功": green, "失敗": red, "エラー": red}
+    
+    def set_details(self, details):
+        """
+        表示する詳細リストを差し替え
+        
+        Args:
+            details: インポート結果の詳細リスト
+        """
+        self.beginResetModel()
+        self._details = details or []
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """行数（結果件数）を返す"""
+        if parent.isValid():
+            return 0
+        return len(self._details)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """列数を返す"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """セルの表示内容を返す"""
+        if not index.isValid():
+            return None
+        
+        detail = self._details[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return detail.get("file_name", "")
+            if column == 1:
+                return detail.get("subdirectory", "")
+            if column == 2:
+                return detail.get("status", "")
+            if column == 3:
+                return detail.get("project_name", "")
+            if detail.get("status") == "成功":
+                return f"フェーズ数: {detail.get('phase_count', 0)}"
+            return detail.get("error", "")
+        
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            return self._status_brushes.get(detail.get("status"))
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """ヘッダーの表示内容を返す"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 
 class BulkExcelImportDialog(QDialog):
     """
@@ -33,9 +164,11 @@ class BulkExcelImportDialog(QDialog):
         
         self.parent = parent
         self.controller = controller
-        self.importer = BulkExcelImporter()
+        self.importer = None  # 初回のインポート実行時に生成
         self.selected_directory = None
         self.import_results = None
+        self._import_thread = None
+        self._import_worker = None
         
         self.init_ui()
     
@@ -111,6 +244,10 @@ class BulkExcelImportDialog(QDialog):
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
         
+        self.progress_label = QLabel("")
+        self.progress_label.setVisible(False)
+        main_layout.addWidget(self.progress_label)
+        
         # 結果表示エリア（初期状態では非表示）
         self.result_group = QGroupBox("インポート結果")
         self.result_group.setVisible(False)
@@ -120,9 +257,9 @@ class BulkExcelImportDialog(QDialog):
         result_layout.addWidget(self.result_summary_label)
         
         # 結果詳細テーブル
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(5)
-        self.result_table.setHorizontalHeaderLabels(["ファイル名", "サブディレクトリ", "状態", "プロジェクト名", "詳細"])
+        self.result_model = ImportResultModel(parent=self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.result_table.horizontalHeader().setStretchLastSection(True)
         result_layout.addWidget(self.result_table)
@@ -146,18 +283,29 @@ class BulkExcelImportDialog(QDialog):
     
     def browse_directory(self):
         """ディレクトリ選択ダイアログを表示"""
+        # 前回のディレクトリから開く（未保存ならカレントディレクトリ）
+        settings = QSettings("Ichimoku", "PM")
+        start_directory = settings.value(_LAST_DIR_KEY, "", type=str)
+        
         directory_path = QFileDialog.getExistingDirectory(
             self,
             "インポート対象ディレクトリを選択",
-            "",
+            start_directory,
             QFileDialog.Option.ShowDirsOnly
         )
         
         if directory_path:
+            settings.setValue(_LAST_DIR_KEY, directory_path)
             self.directory_path_label.setText(directory_path)
             self.selected_directory = directory_path
             self.execute_button.setEnabled(True)
     
+    def reject(self):
+        """キャンセル（インポートの実行中は閉じない）"""
+        if self._import_thread is not None:
+            return
+        super().reject()
+    
     def execute_bulk_import(self):
         """一括インポートを実行"""
         if not self.selected_directory:
@@ -174,6 +322,11 @@ class BulkExcelImportDialog(QDialog):
         else:
             format_type = "auto"  # 自動検出
         
+        # インポーターは openpyxl の読み込みを伴うため、実行時に初めて生成する
+        if self.importer is None:
+            from ...excel.bulk_excel_importer import BulkExcelImporter
+            self.importer = BulkExcelImporter()
+        
         # インポーターにフォーマット情報を渡す
         self.importer.set_format_type(format_type)
         
@@ -181,16 +334,59 @@ class BulkExcelImportDialog(QDialog):
         self.execute_button.setEnabled(False)
         self.browse_button.setEnabled(False)
         self.format_group.setEnabled(False)
+        self.cancel_button.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(10)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("インポート対象を検索中...")
+        self.progress_label.setVisible(True)
+        
+        # インポートはワーカースレッドで実行し、UIスレッドは進捗表示のみ担当
+        self._import_thread = QThread(self)
+        self._import_worker = BulkImportWorker(self.importer, self.selected_directory)
+        self._import_worker.moveToThread(self._import_thread)
+        
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.progress.connect(self.on_import_progress)
+        self._import_worker.finished.connect(self.on_import_finished)
+        self._import_worker.finished.connect(self._import_thread.quit)
+        self._import_worker.finished.connect(self._import_worker.deleteLater)
+        self._import_thread.finished.connect(self._import_thread.deleteLater)
+        
+        self._import_thread.start()
+    
+    def on_import_progress(self, done: int, total: int, file_name: str):
+        """
+        ワーカーからの進捗通知を反映
+        
+        Args:
+            done: 処理済みファイル数
+            total: 対象ファイル総数
+            file_name: 直前に処理したファイル名
+        """
+        # 最後の10%は保存処理用に残しておく
+        if total:
+            self.progress_bar.setValue(done * 90 // total)
+        self.progress_label.setText(f"{done}/{total} 件処理済み: {file_name}")
+    
+    def on_import_finished(self, results: dict):
+        """
+        ワーカー完了時の処理
+        
+        Args:
+            results: インポート結果
+        """
+        # 後続の処理の前にスレッドを確実に停止させる（実行中に破棄されるのを防ぐ）
+        self._import_thread.quit()
+        self._import_thread.wait()
+        
+        self._import_thread = None
+        self._import_worker = None
+        self.import_results = results
+        self.cancel_button.setEnabled(True)
+        self.progress_label.setVisible(False)
+        self.progress_bar.setValue(90)
         
         try:
-            # インポート実行
-            self.import_results = self.importer.bulk_import_from_directory(self.selected_directory)
-            
-            # 進捗更新
-            self.progress_bar.setValue(90)
-            
             # 結果を表示
             self.show_import_results()
             
@@ -198,27 +394,33 @@ class BulkExcelImportDialog(QDialog):
             manager = get_project_manager()
             create_new = self.create_new_project_check.isChecked()
             
-            for project in self.import_results.get("projects", []):
-                # 新規プロジェクトとして保存
-                manager.data_store.save_project(project)
+            projects = self.import_results.get("projects", [])
             
-            # 最後にインポートしたプロジェクトを現在のプロジェクトとして設定
-            if self.import_results.get("projects"):
-                manager.current_project = self.import_results["projects"][-1]
+            # 保存中の通知は保留し、完了後に一度だけ発行する
+            batch = self.controller.batch_updates() if self.controller else nullcontext()
+            with batch:
+                # 新規プロジェクトとしてまとめて保存
+                manager.data_store.save_projects(projects)
                 
-                # コントローラーの通知を発行
-                if self.controller:
-                    self.controller.project_changed.emit()
-                    self.controller.phases_changed.emit()
+                # 最後にインポートしたプロジェクトを現在のプロジェクトとして設定
+                if projects:
+                    manager.current_project = projects[-1]
+                    
+                    # コントローラーの通知を発行
+                    if self.controller:
+                        self.controller.notify_changed("project_changed")
+                        self.controller.notify_changed("phases_changed")
             
             # 完了
             self.progress_bar.setValue(100)
             
         except Exception as e:
             # エラー処理
-            import traceback
             print(f"一括インポート中に例外が発生: {str(e)}")
-            print(traceback.format_exc())
+            if os.environ.get("PM_DEBUG"):
+                # スタックトレースはデバッグ時のみ出力
+                import traceback
+                print(traceback.format_exc())
             QMessageBox.critical(self, "エラー", f"一括インポート中にエラーが発生しました。\n詳細: {str(e)}")
             
             # UI状態を元に戻す
@@ -248,39 +450,16 @@ class BulkExcelImportDialog(QDialog):
         
         # 詳細テーブルの表示
         details = self.import_results.get("details", [])
-        self.result_table.setRowCount(len(details))
         
-        for row, detail in enumerate(details):
-            # ファイル名
-            self.result_table.setItem(row, 0, QTableWidgetItem(detail.get("file_name", "")))
-            
-            # サブディレクトリ
-            self.result_table.setItem(row, 1, QTableWidgetItem(detail.get("subdirectory", "")))
-            
-            # 状態
-            status_item = QTableWidgetItem(detail.get("status", ""))
-            if detail.get("status") == "成功":
-                status_item.setForeground(Qt.GlobalColor.darkGreen)
-            elif detail.get("status") in ["失敗", "エラー"]:
-                status_item.setForeground(Qt.GlobalColor.red)
-            self.result_table.setItem(row, 2, status_item)
-            
-            # プロジェクト名
-            self.result_table.setItem(row, 3, QTableWidgetItem(detail.get("project_name", "")))
-            
-            # 詳細
-            error_detail = detail.get("error", "")
-            phase_count = detail.get("phase_count", 0)
-            
-            if detail.get("status") == "成功":
-                detail_text = f"フェーズ数: {phase_count}"
-            else:
-                detail_text = error_detail
-                
-            self.result_table.setItem(row, 4, QTableWidgetItem(detail_text))
+        # 詳細リストはモデルが直接参照するため、行ごとのアイテム生成は不要
+        self.result_model.set_details(details)
         
-        # 列幅を調整
-        self.result_table.resizeColumnsToContents()
+        # 列幅を調整（全セルを走査するため大量の結果では固定幅にする）
+        if len(details) > _RESIZE_ROW_LIMIT:
+            for column, width in enumerate(_FIXED_COLUMN_WIDTHS):
+                self.result_table.setColumnWidth(column, width)
+        else:
+            self.result_table.resizeColumnsToContents()
         
         # 結果グループを表示
         self.result_group.setVisible(True)
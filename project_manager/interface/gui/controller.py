@@ -2,14 +2,145 @@
 GUIコントローラー
 GUIとProjectManager間の連携を担当
 """
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterator
 from datetime import datetime
+from contextlib import contextmanager
+from collections.abc import Mapping
+from dataclasses import dataclass
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 
 from ...core.manager import get_project_manager
+from ...core.error_handler import log_exception
+from ...core.notification_manager import get_notification_manager
 from ...models import ProjectStatus, TaskStatus
 
+# 状態から表示値を引くための表（Enum の value 参照を避ける）
+_PROJECT_STATUS_VALUE = {status: status.value for status in ProjectStatus}
+_TASK_STATUS_VALUE = {status: status.value for status in TaskStatus}
+
+# 未読通知数を確認する間隔（ミリ秒）
+_NOTIFICATION_POLL_INTERVAL_MS = 60 * 1000
+
+
+class _BackgroundSignals(QObject):
+    """バックグラウンド処理の結果通知用シグナル"""
+    
+    result = pyqtSignal(object)
+
+
+class _BackgroundTask(QRunnable):
+    """
+    関数をスレッドプールで実行し、戻り値をシグナルで通知するタスク
+    """
+    
+    def __init__(self, func: Callable[[], Any]):
+        """
+        タスクの初期化
+        
+        Args:
+            func: バックグラウンドで実行する関数
+        """
+        super().__init__()
+        
+        self.func = func
+        self.signals = _BackgroundSignals()
+    
+    def run(self):
+        """関数を実行して結果を通知"""
+        try:
+            result = self.func()
+        except Exception as e:
+            log_exception(e, "Background task failed")
+            return
+        
+        self.signals.result.emit(result)
+
+
+class LazyProjectView(Mapping):
+    """
+    プロジェクト階層の遅延ビュー
+    
+    詳細情報に子要素のリスト（phases / processes / tasks）を加えた読み取り専用の
+    マッピング。子要素のリストは最初に参照された時点で組み立てる
+    """
+    
+    __slots__ = ("_details", "_children_key", "_load_children", "_children")
+    
+    def __init__(self, details: Dict[str, Any], children_key: str,
+                 load_children: Callable[[], List[Any]]):
+        """
+        ビューの初期化
+        
+        Args:
+            details: エンティティの詳細情報
+            children_key: 子要素のリストを参照するキー
+            load_children: 子要素のリストを組み立てる関数
+        """
+        self._details = details
+        self._children_key = children_key
+        self._load_children = load_children
+        self._children = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == self._children_key:
+            if self._children is None:
+                self._children = self._load_children()
+            return self._children
+        return self._details[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._details
+        yield self._children_key
+    
+    def __len__(self) -> int:
+        return len(self._details) + 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        階層全体を通常の辞書に展開（JSON出力など辞書が必要な場合に使用）
+        
+        Returns:
+            階層構造の辞書
+        """
+        data = dict(self._details)
+        data[self._children_key] = [
+            child.to_dict() if isinstance(child, LazyProjectView) else dict(child)
+            for child in self[self._children_key]
+        ]
+        return data
+
+
+@dataclass
+class ProcessRow:
+    """
+    全プロセス一覧の1行（プロジェクト・フェーズ情報付きのプロセス情報）
+    
+    行数が多くなるため辞書ではなく __slots__ を持つクラスで保持する
+    """
+    
+    __slots__ = (
+        "id", "name", "description", "assignee", "progress", "start_date", "end_date",
+        "estimated_hours", "actual_hours", "task_count",
+        "project_id", "project_name", "phase_id", "phase_name", "days_remaining"
+    )
+    
+    id: str
+    name: str
+    description: str
+    assignee: str
+    progress: float
+    start_date: Optional[str]
+    end_date: Optional[str]
+    estimated_hours: float
+    actual_hours: float
+    task_count: int
+    project_id: str
+    project_name: str
+    phase_id: str
+    phase_name: str
+    days_remaining: Optional[int]
+
 
 class GUIController(QObject):
     """
@@ -21,6 +152,12 @@ class GUIController(QObject):
     phases_changed = pyqtSignal()
     processes_changed = pyqtSignal(str)  # フェーズIDをパラメータとして渡す
     tasks_changed = pyqtSignal(str, str)  # フェーズID, プロセスIDをパラメータとして渡す
+    hierarchy_changed = pyqtSignal(str, str)  # タスク変更で上位階層の進捗率まで変わる場合（フェーズID, プロセスID）
+    
+    # バックグラウンド処理の完了通知用シグナル
+    all_processes_loaded = pyqtSignal(list)  # 全プロセス一覧
+    notifications_checked = pyqtSignal(int)  # 生成された新しい通知の数
+    notifications_changed = pyqtSignal(int)  # 未読通知の数（変化した場合のみ）
     
     def __init__(self):
         """コントローラーの初期化"""
@@ -28,6 +165,226 @@ class GUIController(QObject):
         self.manager = get_project_manager()
         self.current_phase_id = None
         self.current_process_id = None
+        
+        # 現在のプロジェクト（ゲッターの判定用。プロジェクトの切り替え時に更新する）
+        # ダイアログがマネージャーを直接切り替えた場合も project_changed で追従する
+        self._current_project = self.manager.current_project
+        self.project_changed.connect(self._sync_current_project)
+        
+        # 一括更新中に保留している通知（シグナル名, 引数）
+        self._batch_depth = 0
+        self._pending_signals: Dict[Tuple[str, tuple], None] = {}
+        
+        # 詳細情報のキャッシュ（エンティティID -> (更新スタンプ, 詳細情報)）
+        self._detail_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        
+        # 期限までの残り日数のキャッシュ（プロセスID -> (終了日, 残り日数)）。日付が変わったら破棄する
+        self._days_remaining_cache: Dict[str, Tuple[datetime, int]] = {}
+        self._days_remaining_day = None
+        
+        # 全プロセス一覧の要求番号（古い要求の結果が後から届いた場合は破棄する）
+        self._all_processes_seq = 0
+        
+        # 未読通知数の定期確認（最初の確認はイベントループ開始後に行う）
+        self._notif_mgr = get_notification_manager()
+        self._unread_count: Optional[int] = None
+        self._notification_timer = QTimer(self)
+        self._notification_timer.setInterval(_NOTIFICATION_POLL_INTERVAL_MS)
+        self._notification_timer.timeout.connect(self._poll_notifications)
+        self._notification_timer.start()
+        QTimer.singleShot(0, self._poll_notifications)
+    
+    @pyqtSlot()
+    def _sync_current_project(self):
+        """マネージャーの現在のプロジェクトを再取得"""
+        self._current_project = self.manager.current_project
+    
+    # ===== 通知の一括化 =====
+    
+    @contextmanager
+    def batch_updates(self):
+        """
+        ブロック内の変更通知を保留し、終了時に重複を除いて一度だけ発行する
+        
+        入れ子で使用した場合は最も外側のブロックの終了時に発行する
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending = list(self._pending_signals)
+                self._pending_signals.clear()
+                for name, args in pending:
+                    getattr(self, name).emit(*args)
+    
+    def notify_changed(self, signal_name: str, *args) -> None:
+        """
+        変更通知を発行（一括更新中は保留）
+        
+        Args:
+            signal_name: 発行するシグナル名（project_changed など）
+            *args: シグナルの引数
+        """
+        if self._batch_depth:
+            self._pending_signals[(signal_name, args)] = None
+        else:
+            getattr(self, signal_name).emit(*args)
+    
+    # ===== バックグラウンド処理 =====
+    
+    def _run_in_background(self, func: Callable[[], Any], on_result: Callable[[Any], None]) -> None:
+        """
+        関数をスレッドプールで実行し、結果をGUIスレッドで受け取る
+        
+        Args:
+            func: バックグラウンドで実行する関数
+            on_result: 結果を受け取るスロット（このコントローラーのメソッド）
+        """
+        task = _BackgroundTask(func)
+        task.signals.result.connect(on_result)
+        QThreadPool.globalInstance().start(task)
+    
+    def request_all_processes(self) -> None:
+        """
+        全プロセス一覧をバックグラウンドで取得（完了時に all_processes_loaded を発行）
+        
+        現在のプロジェクトの行はGUIスレッドで作成し、他のプロジェクトはバックグラウンドで
+        ログを記録せずにファイルから読み込む。最新の要求の結果だけを通知する
+        """
+        self._all_processes_seq += 1
+        seq = self._all_processes_seq
+        today = datetime.now().date()
+        days_cache = self._copy_days_remaining_cache(today)
+        
+        current = self.manager.current_project
+        current_id = current.id if current else None
+        current_rows = self._build_process_rows(current, today, days_cache) if current else []
+        
+        self._run_in_background(
+            lambda: (seq, today, days_cache, self._load_all_process_rows(current_id, current_rows, today, days_cache)),
+            self._on_all_processes_loaded
+        )
+    
+    def request_notification_check(self) -> None:
+        """
+        新しい通知のチェックを実行（完了時に notifications_checked を発行）
+        
+        通知の生成は通知ファイルの保存やログ出力を伴うため、GUIスレッドで実行する
+        """
+        self._on_notifications_checked(self.check_for_notifications())
+    
+    @pyqtSlot(object)
+    def _on_all_processes_loaded(self, result):
+        seq, today, days_cache, processes = result
+        if seq != self._all_processes_seq:
+            return
+        self._days_remaining_cache = days_cache
+        self._days_remaining_day = today
+        self.all_processes_loaded.emit(processes)
+    
+    @pyqtSlot(object)
+    def _on_notifications_checked(self, new_count):
+        self.notifications_checked.emit(new_count)
+        if new_count:
+            self._poll_notifications()
+    
+    @pyqtSlot()
+    def _poll_notifications(self):
+        """未読通知数を確認し、変化していれば notifications_changed を発行"""
+        unread_count = self.get_unread_notifications_count()
+        if unread_count != self._unread_count:
+            self._unread_count = unread_count
+            self.notifications_changed.emit(unread_count)
+    
+    # ===== 詳細情報のキャッシュ =====
+    
+    def _get_cached_details(self, entity_id: str, stamp: Any) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュ済みの詳細情報を取得
+        
+        Args:
+            entity_id: エンティティID
+            stamp: 現在の更新スタンプ
+            
+        Returns:
+            スタンプが一致した場合はキャッシュ済みの詳細情報、それ以外はNone
+        """
+        cached = self._detail_cache.get(entity_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        return None
+    
+    def _invalidate_details(self, *entity_ids: str) -> None:
+        """
+        詳細情報のキャッシュを破棄
+        
+        Args:
+            *entity_ids: 破棄するエンティティID
+        """
+        for entity_id in entity_ids:
+            self._detail_cache.pop(entity_id, None)
+    
+    @staticmethod
+    def _phase_stamp(phase) -> Tuple[Any, Any]:
+        """
+        フェーズの更新スタンプを取得
+        
+        フェーズの進捗率や日付は配下のプロセスから算出されるため、
+        プロセスの更新日時も含める
+        """
+        return phase.updated_at, max((process.updated_at for process in phase.children), default=None)
+    
+    @staticmethod
+    def _project_stamp(project) -> Tuple[Any, ...]:
+        """
+        プロジェクトの更新スタンプを取得
+        
+        状態・進捗率・日付は配下から算出されるため、フェーズのスタンプも含める
+        """
+        phases = project.children
+        return (
+            project.updated_at,
+            project.status,
+            max((phase.updated_at for phase in phases), default=None),
+            max((process.updated_at for phase in phases for process in phase.children), default=None)
+        )
+    
+    # ===== エンティティの解決 =====
+    
+    def _resolve(self, phase_id: str, process_id: Optional[str] = None,
+                 task_id: Optional[str] = None) -> Optional[Tuple[Any, Any, Any]]:
+        """
+        IDから現在のプロジェクト内のエンティティを一度に取得
+        
+        Args:
+            phase_id: フェーズID
+            process_id: プロセスID（プロセス以下を取得する場合）
+            task_id: タスクID（タスクを取得する場合）
+            
+        Returns:
+            (フェーズ, プロセス, タスク) のタプル（指定されなかった階層はNone）、
+            指定されたいずれかが見つからない場合はNone
+        """
+        project = self._current_project
+        if project is None:
+            return None
+        
+        if task_id is not None:
+            # タスクまではマネージャーのID索引で一度に引く
+            return self.manager.resolve_task(phase_id, process_id, task_id)
+        
+        phase = project.find_phase(phase_id)
+        if not phase:
+            return None
+        if process_id is None:
+            return phase, None, None
+        
+        process = phase.find_process(process_id)
+        if not process:
+            return None
+        return phase, process, None
     
     # ===== プロジェクト操作 =====
     
@@ -54,6 +411,7 @@ class GUIController(QObject):
         project = self.manager.create_project(name, description)
         if project:
             self.manager.current_project = project
+            self._current_project = project
             self.project_changed.emit()
             return True
         return False
@@ -70,6 +428,7 @@ class GUIController(QObject):
         """
         project = self.manager.load_project(project_id)
         if project:
+            self._current_project = project
             self.project_changed.emit()
             self.phases_changed.emit()
             self.current_phase_id = None
@@ -91,11 +450,12 @@ class GUIController(QObject):
         Returns:
             更新が成功したかどうか
         """
-        if not self.manager.current_project:
+        if self._current_project is None:
             return False
         
         result = self.manager.update_project(name, description, status, manual_status)
         if result:
+            self._invalidate_details(self._current_project.id)
             self.project_changed.emit()
         return result
     
@@ -146,9 +506,11 @@ class GUIController(QObject):
             削除が成功したかどうか
         """
         result = self.manager.delete_project(project_id)
+        self._current_project = self.manager.current_project
         if result:
+            self._invalidate_details(project_id)
             # 削除されたプロジェクトが現在のプロジェクトだった場合
-            if self.manager.current_project is None:
+            if self._current_project is None:
                 self.project_changed.emit()
         return result
     
@@ -159,56 +521,69 @@ class GUIController(QObject):
         Returns:
             プロジェクト情報、または None
         """
-        if not self.manager.current_project:
+        project = self._current_project
+        if project is None:
             return None
         
-        project = self.manager.current_project
-        return {
+        stamp = self._project_stamp(project)
+        details = self._get_cached_details(project.id, stamp)
+        if details is not None:
+            return details
+        
+        details = {
             "id": project.id,
             "name": project.name,
             "description": project.description,
-            "status": project.status.value,
+            "status": _PROJECT_STATUS_VALUE[project.status],
             "progress": project.calculate_progress(),
             "start_date": project.get_start_date(),
             "end_date": project.get_end_date(),
             "created_at": project.created_at,
             "updated_at": project.updated_at
         }
+        self._detail_cache[project.id] = (stamp, details)
+        return details
     
-    def get_full_project_data(self) -> Optional[Dict[str, Any]]:
+    def get_full_project_data(self) -> Optional[LazyProjectView]:
         """
         プロジェクトの完全なデータを階層構造で取得
         
+        配下のフェーズ・プロセス・タスクは参照された時点で組み立て、
+        各階層の詳細情報は更新スタンプ付きのキャッシュを再利用する
+        
         Returns:
-            プロジェクト全体のデータ、または None
+            プロジェクト全体のデータ（読み取り専用のマッピング）、または None
         """
-        if not self.manager.current_project:
+        project = self._current_project
+        if project is None:
             return None
         
-        # プロジェクトの基本情報
         project_data = self.get_current_project()
         if not project_data:
             return None
         
-        # フェーズ情報を追加
-        project_data["phases"] = []
-        phases = self.get_phases()
+        # 取得済みのモデルオブジェクトをそのまま渡し、IDからの再検索を行わない
+        phase_to_dict = self._phase_to_dict
+        process_to_dict = self._process_to_dict
+        task_to_dict = self._task_to_dict
         
-        for phase in phases:
-            phase_data = self.get_phase_details(phase["id"])
-            if phase_data:
-                # プロセス情報を追加
-                phase_data["processes"] = []
-                processes = self.get_processes(phase["id"])
-                
-                for process in processes:
-                    process_data = self.get_process_details(phase["id"], process["id"])
-                    if process_data:
-                        # タスク情報を追加
-                        process_data["tasks"] = []
-                        tasks = self.get_tasks(phase["id"], process["id"])
-                        
-
+        def load_processes(phase) -> List[LazyProjectView]:
+            return [
+                LazyProjectView(
+                    process_to_dict(process), "tasks",
+                    lambda process=process: [task_to_dict(task) for task in process.get_tasks()]
+                )
+                for process in phase.get_processes()
+            ]
+        
+        def load_phases() -> List[LazyProjectView]:
+            return [
+                LazyProjectView(phase_to_dict(phase), "processes", lambda phase=phase: load_processes(phase))
+                for phase in project.get_phases()
+            ]
+        
+        return LazyProjectView(project_data, "phases", load_phases)
+    
     # ===== フェーズ操作 =====
     
     def get_phases(self) -> List[Dict[str, Any]]:
@@ -218,7 +593,7 @@ class GUIController(QObject):
         Returns:
             フェーズ一覧
         """
-        if not self.manager.current_project:
+        if self._current_project is None:
             return []
         
         return self.manager.get_phases()
@@ -256,6 +631,7 @@ class GUIController(QObject):
         """
         result = self.manager.update_phase(phase_id, name, description, end_date)
         if result:
+            self._invalidate_details(phase_id)
             self.phases_changed.emit()
         return result
     
@@ -271,6 +647,7 @@ class GUIController(QObject):
         """
         result = self.manager.remove_phase(phase_id)
         if result:
+            self._invalidate_details(phase_id)
             self.phases_changed.emit()
             # 削除されたフェーズが現在のフェーズだった場合
             if self.current_phase_id == phase_id:
@@ -278,6 +655,7 @@ class GUIController(QObject):
                 self.current_process_id = None
         return result
     
+    @pyqtSlot(str)
     def set_current_phase(self, phase_id: str):
         """
         現在のフェーズを設定
@@ -299,14 +677,28 @@ class GUIController(QObject):
         Returns:
             フェーズ情報、または None
         """
-        if not self.manager.current_project:
+        resolved = self._resolve(phase_id)
+        if not resolved:
             return None
         
-        phase = self.manager.current_project.find_phase(phase_id)
-        if not phase:
-            return None
+        return self._phase_to_dict(resolved[0])
+    
+    def _phase_to_dict(self, phase) -> Dict[str, Any]:
+        """
+        フェーズの詳細情報を作成（更新スタンプが同じならキャッシュを返す）
         
-        return {
+        Args:
+            phase: フェーズ
+            
+        Returns:
+            フェーズ情報
+        """
+        stamp = self._phase_stamp(phase)
+        details = self._get_cached_details(phase.id, stamp)
+        if details is not None:
+            return details
+        
+        details = {
             "id": phase.id,
             "name": phase.name,
             "description": phase.description,
@@ -316,6 +708,8 @@ class GUIController(QObject):
             "created_at": phase.created_at,
             "updated_at": phase.updated_at
         }
+        self._detail_cache[phase.id] = (stamp, details)
+        return details
     
     # ===== プロセス操作 =====
     
@@ -329,82 +723,129 @@ class GUIController(QObject):
         Returns:
             プロセス一覧
         """
-        if not self.manager.current_project:
+        if self._current_project is None:
             return []
         
         return self.manager.get_processes(phase_id)
 
-    def get_all_processes(self) -> List[Dict[str, Any]]:
+    def get_all_processes(self) -> List[ProcessRow]:
+        """
+        すべてのプロジェクトのプロセスをプロジェクト・フェーズ情報付きで取得
+        
+        Returns:
+            プロセス情報の行のリスト（残り日数を含む）
+        """
+        all_processes = []
+        today = datetime.now().date()
+        days_cache = self._copy_days_remaining_cache(today)
+        
+        # 各プロジェクトは一度だけ読み込み、現在のプロジェクトは切り替えない
+        for project_obj in self.manager.iter_projects_loaded():
+            all_processes.extend(self._build_process_rows(project_obj, today, days_cache))
+        
+        self._days_remaining_cache = days_cache
+        self._days_remaining_day = today
+        
+        return all_processes
+    
+    def _load_all_process_rows(self, current_id: Optional[str], current_rows: List[ProcessRow],
+                               today, days_cache: Dict[str, Tuple[datetime, int]]) -> List[ProcessRow]:
+        """
+        保存済みのプロジェクトを読み込んで全プロセス一覧を作成（バックグラウンドスレッドで実行）
+        
+        現在のプロジェクトには触れず、GUIスレッドで作成済みの行をその位置に入れる
+        
+        Args:
+            current_id: 現在のプロジェクトのID
+            current_rows: 現在のプロジェクトのプロセス行
+            today: 残り日数の基準日
+            days_cache: この要求専用の残り日数キャッシュ
+            
+        Returns:
+            プロセス情報の行のリスト
+        """
         all_processes = []
         
-        # 現在のプロジェクトIDを保存
-        current_project_id = None
-        if self.manager.current_project:
-            current_project_id = self.manager.current_project.id
+        for project_id, project_obj in self.manager.iter_saved_projects(skip_id=current_id):
+            if project_obj is None:
+                all_processes.extend(current_rows)
+            else:
+                all_processes.extend(self._build_process_rows(project_obj, today, days_cache))
         
-        # すべてのプロジェクトを取得
-        projects = self.manager.list_projects()
+        return all_processes
+    
+    def _copy_days_remaining_cache(self, today) -> Dict[str, Tuple[datetime, int]]:
+        """
+        残り日数キャッシュの複製を取得（日付が変わっていれば空のキャッシュ）
         
-        for project in projects:
-            project_id = project["id"]
-            project_name = project["name"]
+        Args:
+            today: 残り日数の基準日
             
-            # プロジェクトを読み込み
-            project_obj = self.manager.load_project(project_id)
-            if not project_obj:
-                continue
+        Returns:
+            残り日数キャッシュの複製
+        """
+        if self._days_remaining_day != today:
+            return {}
+        return dict(self._days_remaining_cache)
+    
+    def _build_process_rows(self, project_obj, today, days_cache: Dict[str, Tuple[datetime, int]]) -> List[ProcessRow]:
+        """
+        プロジェクトのプロセスをプロジェクト・フェーズ情報付きの行に変換
+        
+        Args:
+            project_obj: プロジェクト
+            today: 残り日数の基準日
+            days_cache: 残り日数キャッシュ（計算した値を追加する）
             
-            # このプロジェクトのすべてのフェーズを取得
-            phases = self.get_phases()
+        Returns:
+            プロセス情報の行のリスト
+        """
+        rows = []
+        
+        # ループ内で繰り返し参照するものはローカル変数に束縛しておく
+        append = rows.append
+        project_id = project_obj.id
+        project_name = project_obj.name
+        
+        for phase in project_obj.get_phases():
+            phase_id = phase.id
+            phase_name = phase.name
             
-            for phase in phases:
-                phase_id = phase["id"]
-                phase_name = phase["name"]
-                
-                # このフェーズのすべてのプロセスを取得
-                processes = self.get_processes(phase_id)
+            for process in phase.get_processes():
+                start_date = process.start_date
+                end_date = process.end_date
                 
-                # プロセスのループを開始する前に、processes配列が空でないか確認する
-                if not processes:
-                    continue
-                    
-                for process in processes:
-                    # 各プロセスにプロジェクトとフェーズのコンテキストを追加
-                    process_with_context = process.copy()
-                    process_with_context["project_id"] = project_id
-                    process_with_context["project_name"] = project_name
-                    process_with_context["phase_id"] = phase_id
-                    process_with_context["phase_name"] = phase_name
-                    
-                    # 期限までの残り日数を計算
-                    end_date = process.get("end_date")
-                    if end_date:
-                        if isinstance(end_date, str):
-                            try:
-                                end_date = datetime.fromisoformat(end_date)
-                            except ValueError:
-                                # 解析できない場合はNoneとする
-                                end_date = None
-                        
-                        # datetime型の場合のみ計算を実行
-                        if isinstance(end_date, datetime):
-                            today = datetime.now().date()
-                            end_date_date = end_date.date()
-                            days_remaining = (end_date_date - today).days
-                            process_with_context["days_remaining"] = days_remaining
-                        else:
-                            # datetime型でない場合は残り日数をNoneに設定
-                            process_with_context["days_remaining"] = None
+                # 残り日数は終了日が同じなら当日中は変わらないため使い回す
+                if end_date:
+                    cached = days_cache.get(process.id)
+                    if cached is not None and cached[0] == end_date:
+                        days_remaining = cached[1]
                     else:
-                        process_with_context["days_remaining"] = None
-                    
-                    all_processes.append(process_with_context)
-            
-            # 元のプロジェクトを復元
-            if current_project_id:
-                self.manager.load_project(current_project_id)
+                        days_remaining = (end_date.date() - today).days
+                        days_cache[process.id] = (end_date, days_remaining)
+                else:
+                    days_remaining = None
+                
+                # プロセス情報にプロジェクト・フェーズのコンテキストと期限までの残り日数を加えた行
+                append(ProcessRow(
+                    process.id,
+                    process.name,
+                    process.description,
+                    process.assignee,
+                    process.progress,
+                    start_date.isoformat() if start_date else None,
+                    end_date.isoformat() if end_date else None,
+                    process.estimated_hours,
+                    process.actual_hours,
+                    len(process.children),
+                    project_id,
+                    project_name,
+                    phase_id,
+                    phase_name,
+                    days_remaining
+                ))
         
-        return all_processes
+        return rows
 
     def create_process(self, phase_id: str, name: str, description: str = "", assignee: str = "") -> bool:
         """
@@ -451,6 +892,7 @@ class GUIController(QObject):
             start_date, end_date, estimated_hours, actual_hours
         )
         if result:
+            self._invalidate_details(process_id)
             self.processes_changed.emit(phase_id)
         return result
     
@@ -467,12 +909,14 @@ class GUIController(QObject):
         """
         result = self.manager.remove_process(phase_id, process_id)
         if result:
+            self._invalidate_details(process_id)
             self.processes_changed.emit(phase_id)
             # 削除されたプロセスが現在のプロセスだった場合
             if self.current_process_id == process_id:
                 self.current_process_id = None
         return result
     
+    @pyqtSlot(str, str)
     def set_current_process(self, phase_id: str, process_id: str):
         """
         現在のプロセスを設定
@@ -496,18 +940,27 @@ class GUIController(QObject):
         Returns:
             プロセス情報、または None
         """
-        if not self.manager.current_project:
+        resolved = self._resolve(phase_id, process_id)
+        if not resolved:
             return None
         
-        phase = self.manager.current_project.find_phase(phase_id)
-        if not phase:
-            return None
+        return self._process_to_dict(resolved[1])
+    
+    def _process_to_dict(self, process) -> Dict[str, Any]:
+        """
+        プロセスの詳細情報を作成（更新日時が同じならキャッシュを返す）
         
-        process = phase.find_process(process_id)
-        if not process:
-            return None
+        Args:
+            process: プロセス
+            
+        Returns:
+            プロセス情報
+        """
+        details = self._get_cached_details(process.id, process.updated_at)
+        if details is not None:
+            return details
         
-        return {
+        details = {
             "id": process.id,
             "name": process.name,
             "description": process.description,
@@ -520,6 +973,8 @@ class GUIController(QObject):
             "created_at": process.created_at,
             "updated_at": process.updated_at
         }
+        self._detail_cache[process.id] = (process.updated_at, details)
+        return details
     
     # ===== タスク操作 =====
     
@@ -534,7 +989,7 @@ class GUIController(QObject):
         Returns:
             タスク一覧
         """
-        if not self.manager.current_project:
+        if self._current_project is None:
             return []
         
         return self.manager.get_tasks(phase_id, process_id)
@@ -556,10 +1011,8 @@ class GUIController(QObject):
         """
         task = self.manager.add_task(phase_id, process_id, name, description, status)
         if task:
-            self.tasks_changed.emit(phase_id, process_id)
-            self.processes_changed.emit(phase_id)  # 進捗率が変わるため
-            self.phases_changed.emit()  # フェーズの進捗率も変わるため
-            self.project_changed.emit()  # プロジェクトの進捗率も変わるため
+            # プロセス・フェーズ・プロジェクトの進捗率も変わるため、まとめて一度だけ通知
+            self.notify_changed("hierarchy_changed", phase_id, process_id)
             return True
         return False
     
@@ -583,11 +1036,11 @@ class GUIController(QObject):
             phase_id, process_id, task_id, name, description, status
         )
         if result:
-            self.tasks_changed.emit(phase_id, process_id)
+            self._invalidate_details(task_id)
             if status is not None:  # 状態が変更された場合は上位階層の進捗率も更新
-                self.processes_changed.emit(phase_id)
-                self.phases_changed.emit()
-                self.project_changed.emit()
+                self.notify_changed("hierarchy_changed", phase_id, process_id)
+            else:
+                self.notify_changed("tasks_changed", phase_id, process_id)
         return result
     
     def delete_task(self, phase_id: str, process_id: str, task_id: str) -> bool:
@@ -604,10 +1057,9 @@ class GUIController(QObject):
         """
         result = self.manager.remove_task(phase_id, process_id, task_id)
         if result:
-            self.tasks_changed.emit(phase_id, process_id)
-            self.processes_changed.emit(phase_id)  # 進捗率が変わるため
-            self.phases_changed.emit()  # フェーズの進捗率も変わるため
-            self.project_changed.emit()  # プロジェクトの進捗率も変わるため
+            self._invalidate_details(task_id)
+            # プロセス・フェーズ・プロジェクトの進捗率も変わるため、まとめて一度だけ通知
+            self.notify_changed("hierarchy_changed", phase_id, process_id)
         return result
     
     def get_task_details(self, phase_id: str, process_id: str, task_id: str) -> Optional[Dict[str, Any]]:
@@ -622,44 +1074,53 @@ class GUIController(QObject):
         Returns:
             タスク情報、または None
         """
-        if not self.manager.current_project:
-            return None
-        
-        phase = self.manager.current_project.find_phase(phase_id)
-        if not phase:
+        resolved = self._resolve(phase_id, process_id, task_id)
+        if not resolved:
             return None
         
-        process = phase.find_process(process_id)
-        if not process:
-            return None
+        return self._task_to_dict(resolved[2])
+    
+    def _task_to_dict(self, task) -> Dict[str, Any]:
+        """
+        タスクの詳細情報を作成（更新日時が同じならキャッシュを返す）
         
-        task = process.find_task(task_id)
-        if not task:
-            return None
+        Args:
+            task: タスク
+            
+        Returns:
+            タスク情報
+        """
+        details = self._get_cached_details(task.id, task.updated_at)
+        if details is not None:
+            return details
         
-        return {
+        details = {
             "id": task.id,
             "name": task.name,
             "description": task.description,
-            "status": task.status.value,
+            "status": _TASK_STATUS_VALUE[task.status],
             "created_at": task.created_at,
             "updated_at": task.updated_at
         }
+        self._detail_cache[task.id] = (task.updated_at, details)
+        return details
     
-    def get_task_history(self, task_id: str) -> List[Dict[str, Any]]:
+    def get_task_history(self, task_id: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         """
         タスクの履歴を取得
         
         Args:
             task_id: タスクID
+            limit: 取得する最大件数
+            offset: 新しい方から読み飛ばす件数
             
         Returns:
-            タスクの履歴リスト
+            タスクの履歴リスト（古い順）
         """
-        if not self.manager.current_project:
+        if self._current_project is None:
             return []
         
-        return self.manager.get_entity_history(task_id)
+        return self.manager.get_entity_history(task_id, limit=limit, offset=offset)
     
     # ===== 通知操作 =====
     def get_notifications(self) -> List[Dict[str, Any]]:
@@ -669,13 +1130,11 @@ class GUIController(QObject):
         Returns:
             通知のリスト
         """
-        from ...core.notification_manager import get_notification_manager
-        
-        notification_manager = get_notification_manager()
-        notifications = notification_manager.get_all_notifications()
+        notifications = self._notif_mgr.get_all_notifications()
         
         return [notification.to_dict() for notification in notifications]
 
+    @pyqtSlot(result=int)
     def get_unread_notifications_count(self) -> int:
         """
         未読通知の数を取得
@@ -683,11 +1142,9 @@ class GUIController(QObject):
         Returns:
             未読通知の数
         """
-        from ...core.notification_manager import get_notification_manager
-        
-        notification_manager = get_notification_manager()
-        return len(notification_manager.get_unread_notifications())
+        return len(self._notif_mgr.get_unread_notifications())
 
+    @pyqtSlot(result=int)
     def check_for_notifications(self) -> int:
         """
         新しい通知をチェック
@@ -695,7 +1152,4 @@ class GUIController(QObject):
         Returns:
             生成された新しい通知の数
         """
-        from ...core.notification_manager import get_notification_manager
-        
-        notification_manager = get_notification_manager()
-        return notification_manager.generate_notifications()
+        return self._notif_mgr.generate_notifications()
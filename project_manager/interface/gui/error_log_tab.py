@@ -2,22 +2,262 @@
 エラーログタブ
 システムのエラーログを表示・検索する機能を提供
 """
-from typing import Dict, Any, List, Optional
+import csv
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
+from collections import Counter
+from functools import lru_cache
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QComboBox, QTableView, QHeaderView,
     QDateEdit, QLineEdit, QFormLayout, QGroupBox, QTextEdit,
     QDialog, QDialogButtonBox, QCheckBox, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, QDate, QDateTime, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import (
+    Qt, QDate, QDateTime, QTimer, QSignalBlocker, pyqtSignal, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PyQt6.QtGui import QColor, QFont
 
 from ...core.logger import get_logger, LogLevel
 from ...core.error_handler import log_exception
 from .utils import show_error_message, show_info_message
 
+try:
+    # orjson が利用できる場合はエクスポート時のJSON変換に使用する
+    import orjson
+    
+    def _json_dumps(data: Any) -> bytes:
+        """
+        データを整形済みのJSON（UTF-8）に変換
+        
+        Args:
+            data: 変換するデータ
+            
+        Returns:
+            JSONのバイト列
+        """
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+    
+    def _json_dumps(data: Any) -> bytes:
+        """
+        データを整形済みのJSON（UTF-8）に変換（orjson が利用できない場合の実装）
+        
+        Args:
+            data: 変換するデータ
+            
+        Returns:
+            JSONのバイト列
+        """
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+# 取得結果のキャッシュを有効とみなす時間（ミリ秒）
+_LOG_CACHE_TTL_MS = 60 * 1000
+
+# 一度に読み込むエラーログの最大件数（テキスト検索はこの件数の中だけを絞り込む）
+_MAX_LOADED_LOGS = 1000
+
+# この行数を超える場合は行の高さを内容に合わせない（全セルを計測するため）
+_RESIZE_ROW_LIMIT = 200
+
+# CSVエクスポート時の書き込みバッファサイズ（行ごとの書き込みをまとめる）
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# レベルごとの表示スタイル（ラベル用のスタイルシート）
+_LEVEL_STYLESHEETS = {
+    LogLevel.CRITICAL: "color: red; font-weight: bold;",
+    LogLevel.ERROR: "color: red;",
+    LogLevel.WARNING: "color: orange;"
+}
+
+
+@lru_cache(maxsize=16)
+def _fetch_logs(level: Optional[str], start: datetime, end: datetime, module: Optional[str],
+                limit: int, cache_epoch: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    エラーログを取得（同じ条件・同じ世代の呼び出しはキャッシュを返す）
+    
+    Args:
+        level: フィルタリングするエラーレベル
+        start: 検索開始日時
+        end: 検索終了日時
+        module: フィルタリングするモジュール名
+        limit: 取得する最大件数
+        cache_epoch: キャッシュの世代（変更すると再取得する）
+        
+    Returns:
+        エラーログのタプル
+    """
+    return tuple(get_logger().get_error_logs(
+        level=level,
+        start_date=start,
+        end_date=end,
+        module=module,
+        limit=limit
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _format_ts(timestamp: Optional[str]) -> str:
+    """
+    ログの発生日時（ISO形式）を表示用の文字列に変換
+    
+    再読み込みのたびに同じログが取得されるため、元の文字列ごとに結果をキャッシュする
+    
+    Args:
+        timestamp: ISO形式の日時文字列
+        
+    Returns:
+        表示用の日時文字列（解析できない場合は「不明」）
+    """
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return "不明"
+
+
+def _without_display_fields(log: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    表示用に追加した項目（_display_ts など）を除いたログを取得
+    
+    Args:
+        log: エラーログ
+        
+    Returns:
+        元の項目のみのログ
+    """
+    return {key: value for key, value in log.items() if not key.startswith("_")}
+
+
+class ErrorLogModel(QAbstractTableModel):
+    """
+    エラーログ一覧を表示するテーブルモデル
+    
+    表示用の文字列はログの設定時に一度だけ作成し、描画時は参照のみ行う
+    （発生日時は読み込み時に整形済みの _display_ts を使用する）
+    """
+    
+    HEADERS = ["発生日時", "レベル", "メッセージ", "モジュール", "関数"]
+    LEVEL_COLUMN = 1
+    
+    # テキスト検索の対象（メッセージ・モジュール名・関数名）を返すロール
+    SEARCH_ROLE = Qt.ItemDataRole.UserRole + 1
+    
+    # レベルごとの (文字色, フォント)。QApplication 作成後に最初のモデルで一度だけ作る
+    _LEVEL_STYLES: Optional[Dict[str, tuple]] = None
+    
+    def __init__(self, parent=None):
+        """
+        モデルの初期化
+        
+        Args:
+            parent: 親オブジェクト
+        """
+        super().__init__(parent)
+        
+        self._logs: List[Dict[str, Any]] = []
+        self._rows: List[tuple] = []
+        self._search_texts: List[str] = []
+        
+        if ErrorLogModel._LEVEL_STYLES is None:
+            red = QColor(255, 0, 0)
+            orange = QColor(255, 165, 0)
+            bold_font = QFont()
+            bold_font.setBold(True)
+            ErrorLogModel._LEVEL_STYLES = {
+                LogLevel.CRITICAL: (red, bold_font),
+                LogLevel.ERROR: (red, None),
+                LogLevel.WARNING: (orange, None)
+            }
+    
+    def set_logs(self, logs: List[Dict[str, Any]]):
+        """
+        表示するログを差し替え
+        
+        Args:
+            logs: エラーログのリスト
+        """
+        self.beginResetModel()
+        self._logs = logs
+        self._rows = [
+            (
+                log["_display_ts"],
+                log.get("level", "不明"),
+                log.get("message", "不明"),
+                log.get("module", "不明"),
+                log.get("function", "不明")
+            )
+            for log in logs
+        ]
+        # 項目をまたいで一致しないよう改行で区切る（検索欄には改行を入力できない）
+        self._search_texts = [
+            f"{log.get('message', '')}\n{log.get('module', '')}\n{log.get('function', '')}"
+            for log in logs
+        ]
+        self.endResetModel()
+    
+    def log_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """
+        指定行の元のログデータを取得
+        
+        Args:
+            row: 行番号
+            
+        Returns:
+            ログデータ、範囲外の場合はNone
+        """
+        if 0 <= row < len(self._logs):
+            return self._logs[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()):
+        """行数（ログ件数）を返す"""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """列数を返す"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """セルの表示内容を返す"""
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[column]
+        
+        if column == self.LEVEL_COLUMN:
+            style = self._LEVEL_STYLES.get(row[column])
+            if style is not None:
+                if role == Qt.ItemDataRole.ForegroundRole:
+                    return style[0]
+                if role == Qt.ItemDataRole.FontRole:
+                    return style[1]
+        
+        if role == Qt.ItemDataRole.UserRole:
+            return self._logs[index.row()]
+        
+        if role == self.SEARCH_ROLE:
+            return self._search_texts[index.row()]
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """ヘッダーの表示内容を返す"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 
 class ErrorDetailsDialog(QDialog):
     """エラー詳細を表示するダイアログ"""
@@ -104,27 +344,20 @@ class ErrorDetailsDialog(QDialog):
         Args:
             error_data: エラー情報
         """
-        # タイムスタンプ
-        if "timestamp" in error_data:
-            try:
-                timestamp = datetime.fromisoformat(error_data["timestamp"])
-                self.timestamp_label.setText(timestamp.strftime("%Y-%m-%d %H:%M:%S"))
-            except (ValueError, TypeError):
-                self.timestamp_label.setText(str(error_data.get("timestamp", "不明")))
-        else:
-            self.timestamp_label.setText("不明")
+        self.error_data = error_data
+        
+        # タイムスタンプ（一覧の読み込み時に整形済み）
+        display_ts = error_data.get("_display_ts")
+        if display_ts is None:
+            display_ts = _format_ts(error_data.get("timestamp"))
+        self.timestamp_label.setText(display_ts)
         
         # レベル
         level = error_data.get("level", "不明")
         self.level_label.setText(level)
         
-        # レベルに応じた色を設定
-        if level == LogLevel.CRITICAL:
-            self.level_label.setStyleSheet("color: red; font-weight: bold;")
-        elif level == LogLevel.ERROR:
-            self.level_label.setStyleSheet("color: red;")
-        elif level == LogLevel.WARNING:
-            self.level_label.setStyleSheet("color: orange;")
+        # レベルに応じた色を設定（ダイアログは再利用されるため、該当しないレベルでは解除する）
+        self.level_label.setStyleSheet(_LEVEL_STYLESHEETS.get(level, ""))
         
         # メッセージ
         self.message_label.setText(error_data.get("message", "不明"))
@@ -148,10 +381,7 @@ class ErrorDetailsDialog(QDialog):
         # 詳細情報
         details = error_data.get("details", {})
         if details:
-            details_text = ""
-            for key, value in details.items():
-                details_text += f"{key}: {value}\n"
-            self.details_edit.setText(details_text)
+            self.details_edit.setText("\n".join(f"{key}: {value}" for key, value in details.items()))
         else:
             self.details_edit.setText("詳細情報はありません")
     
@@ -173,9 +403,8 @@ class ErrorDetailsDialog(QDialog):
         try:
             # ファイル拡張子に応じてフォーマットを変更
             if filename.endswith('.json'):
-                import json
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.error_data, f, ensure_ascii=False, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(_json_dumps(_without_display_fields(self.error_data)))
             else:
                 # テキスト形式（.txt）
                 with open(filename, 'w', encoding='utf-8') as f:
@@ -221,6 +450,24 @@ class ErrorLogTab(QWidget):
         self.current_filters = {}
         self.error_logs = []
         
+        # モジュールコンボボックスに登録済みのモジュール
+        self._known_modules: FrozenSet[str] = frozenset()
+        
+        # タブが非表示の間に読み込んだモジュール（表示時にコンボボックスへ反映する）
+        self._pending_modules: Optional[FrozenSet[str]] = None
+        
+        # 読み込んだログのレベル別の件数
+        self._level_counts: Counter = Counter()
+        
+        # エラー詳細ダイアログ（初回表示時に作成し、以降は内容を差し替えて再利用）
+        self._details_dialog: Optional[ErrorDetailsDialog] = None
+        
+        # 取得結果キャッシュの世代（更新ボタンと一定時間ごとに進めて再取得させる）
+        self._cache_epoch = 0
+        self._cache_timer = QTimer(self)
+        self._cache_timer.timeout.connect(self.invalidate_log_cache)
+        self._cache_timer.start(_LOG_CACHE_TTL_MS)
+        
         self.init_ui()
         self.load_error_logs()
     
@@ -269,8 +516,8 @@ class ErrorLogTab(QWidget):
         
         # テキスト検索
         self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("テキスト検索...")
-        self.search_edit.returnPressed.connect(self.apply_filters)
+        self.search_edit.setPlaceholderText(f"テキスト検索（読み込み済みの最大{_MAX_LOADED_LOGS}件が対象）...")
+        self.search_edit.textChanged.connect(self.on_search_text_changed)
         filter_layout.addRow("検索:", self.search_edit)
         
         # フィルターボタン
@@ -312,7 +559,7 @@ class ErrorLogTab(QWidget):
         stats_layout.addStretch()
         
         refresh_button = QPushButton("更新")
-        refresh_button.clicked.connect(self.load_error_logs)
+        refresh_button.clicked.connect(self.refresh_error_logs)
         stats_layout.addWidget(refresh_button)
         
         export_button = QPushButton("エクスポート")
@@ -322,13 +569,20 @@ class ErrorLogTab(QWidget):
         main_layout.addWidget(stats_group)
         
         # エラーログテーブル
-        self.error_table = QTableWidget()
-        self.error_table.setColumnCount(5)
-        self.error_table.setHorizontalHeaderLabels(["発生日時", "レベル", "メッセージ", "モジュール", "関数"])
+        self.error_model = ErrorLogModel(self)
         
-        # リサイズ可能に変更
+        # テキスト検索は読み込み済みのログに対してプロキシモデルで絞り込む（入力のたびに再取得しない）
+        self.error_proxy = QSortFilterProxyModel(self)
+        self.error_proxy.setSourceModel(self.error_model)
+        self.error_proxy.setFilterRole(ErrorLogModel.SEARCH_ROLE)
+        self.error_proxy.setFilterKeyColumn(0)
+        self.error_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        
+        self.error_table = QTableView()
+        self.error_table.setModel(self.error_proxy)
+        
+        # リサイズ可能に変更（行の高さは更新時に件数が少ない場合のみ内容に合わせる）
         self.error_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.error_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         
         # 初期列幅を設定
         self.error_table.setColumnWidth(0, 180)  # 発生日時
@@ -337,12 +591,12 @@ class ErrorLogTab(QWidget):
         self.error_table.setColumnWidth(3, 150)  # モジュール
         self.error_table.setColumnWidth(4, 150)  # 関数
         
-        self.error_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.error_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.error_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.error_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.error_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.error_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         
         # ダブルクリックで詳細表示
-        self.error_table.cellDoubleClicked.connect(self.show_error_details)
+        self.error_table.doubleClicked.connect(self.show_error_details)
         
         main_layout.addWidget(self.error_table)
         
@@ -371,20 +625,27 @@ class ErrorLogTab(QWidget):
             
             module = self.module_combo.currentData()
             
-            # エラーログを取得
-            self.error_logs = self.logger.get_error_logs(
-                level=level,
-                start_date=start_datetime,
-                end_date=end_datetime,
-                module=module,
-                limit=1000  # 最大1000件まで取得
-            )
+            # エラーログを取得（最大件数まで。テキスト検索は表示時にプロキシモデルで適用する）
+            self.error_logs = list(_fetch_logs(
+                level, start_datetime, end_datetime, module, _MAX_LOADED_LOGS, self._cache_epoch
+            ))
+            
+            # 発生日時の整形、モジュールの収集、レベル別の集計を一度の走査で行う（キャッシュ済みのログは整形済み）
+            modules = set()
+            level_counts = Counter()
+            for log in self.error_logs:
+                if "_display_ts" not in log:
+                    log["_display_ts"] = _format_ts(log.get("timestamp"))
+                if log.get("module"):
+                    modules.add(log["module"])
+                level_counts[log.get("level")] += 1
+            self._level_counts = level_counts
             
             # テーブルを更新
             self.update_error_table()
             
             # モジュールコンボボックスの選択肢を更新
-            self.update_module_combo()
+            self.update_module_combo(frozenset(modules))
             
             # 統計情報を更新
             self.update_statistics()
@@ -392,131 +653,118 @@ class ErrorLogTab(QWidget):
             show_error_message(self, "エラー", f"エラーログの読み込みに失敗しました: {str(e)}")
             log_exception(e, "Failed to load error logs")
     
+    def invalidate_log_cache(self):
+        """取得結果のキャッシュを無効化（次回の読み込みで再取得する）"""
+        self._cache_epoch += 1
+    
+    def refresh_error_logs(self):
+        """キャッシュを無効化してエラーログを再読み込み"""
+        self.invalidate_log_cache()
+        self.load_error_logs()
+    
     def update_error_table(self):
         """エラーログテーブルを更新"""
-        # 事前にテーブルをクリア
-        self.error_table.setRowCount(0)
-        
-        # 検索テキストでフィルタリング
-        search_text = self.search_edit.text().lower()
-        filtered_logs = []
-        
-        for log in self.error_logs:
-            # 検索テキストがある場合はフィルタリング
-            if search_text:
-                # メッセージ、モジュール、関数名から検索
-                message = str(log.get("message", "")).lower()
-                module = str(log.get("module", "")).lower()
-                function = str(log.get("function", "")).lower()
-                
-                if (search_text in message or search_text in module or search_text in function):
-                    filtered_logs.append(log)
-            else:
-                filtered_logs.append(log)
-        
-        # テーブルに追加
-        self.error_table.setRowCount(len(filtered_logs))
-        
-        for row, log in enumerate(filtered_logs):
-            # 発生日時
-            timestamp = "不明"
-            try:
-                if "timestamp" in log:
-                    timestamp = datetime.fromisoformat(log["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                pass
-            
-            timestamp_item = QTableWidgetItem(timestamp)
-            self.error_table.setItem(row, 0, timestamp_item)
-            
-            # レベル
-            level = log.get("level", "不明")
-            level_item = QTableWidgetItem(level)
-            
-            # レベルに応じた色を設定
-            if level == LogLevel.CRITICAL:
-                level_item.setForeground(QColor(255, 0, 0))  # 赤
-                level_item.setFont(level_item.font())
-                font = level_item.font()
-                font.setBold(True)
-                level_item.setFont(font)
-            elif level == LogLevel.ERROR:
-                level_item.setForeground(QColor(255, 0, 0))  # 赤
-            elif level == LogLevel.WARNING:
-                level_item.setForeground(QColor(255, 165, 0))  # オレンジ
-            
-            self.error_table.setItem(row, 1, level_item)
-            
-            # メッセージ
-            message = log.get("message", "不明")
-            message_item = QTableWidgetItem(message)
-            self.error_table.setItem(row, 2, message_item)
-            
-            # モジュール
-            module = log.get("module", "不明")
-            module_item = QTableWidgetItem(module)
-            self.error_table.setItem(row, 3, module_item)
-            
-            # 関数
-            function = log.get("function", "不明")
-            function_item = QTableWidgetItem(function)
-            self.error_table.setItem(row, 4, function_item)
-            
-            # 元のログデータをユーザーデータとして保存
-            self.error_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, log)
+        # 検索テキストは error_proxy で絞り込むため、読み込んだログをそのままモデルに渡す（描画は表示中の行のみ行われる）
+        self.error_model.set_logs(self.error_logs)
+        
+        if len(self.error_logs) <= _RESIZE_ROW_LIMIT:
+            self.error_table.resizeRowsToContents()
     
-    def update_module_combo(self):
-        """モジュールコンボボックスの選択肢を更新"""
-        # 現在の選択を保存
-        current_selection = self.module_combo.currentData()
+    def showEvent(self, event):
+        """
+        表示時に、非表示の間に保留したモジュールコンボボックスの更新を反映
         
-        # シグナルをブロック（追加）
-        self.module_combo.blockSignals(True)
+        Args:
+            event: 表示イベント
+        """
+        super().showEvent(event)
         
-        # コンボボックスをクリア
-        self.module_combo.clear()
-        self.module_combo.addItem("すべてのモジュール", None)
+        if self._pending_modules is not None:
+            modules = self._pending_modules
+            self._pending_modules = None
+            self._rebuild_module_combo(modules)
+    
+    def update_module_combo(self, modules: FrozenSet[str]):
+        """
+        モジュールコンボボックスの選択肢を更新（タブが非表示の場合は表示時まで保留）
+        
+        Args:
+            modules: 読み込んだログに含まれるモジュール
+        """
+        if not self.isVisible():
+            self._pending_modules = modules
+            return
         
-        # モジュールリストを収集
-        modules = set()
-        for log in self.error_logs:
-            if "module" in log and log["module"]:
-                modules.add(log["module"])
+        self._pending_modules = None
+        self._rebuild_module_combo(modules)
+    
+    def _rebuild_module_combo(self, modules: FrozenSet[str]):
+        """
+        モジュールコンボボックスの選択肢を作り直す
         
-        # モジュールリストをコンボボックスに追加
-        for module in sorted(modules):
-            self.module_combo.addItem(module, module)
+        Args:
+            modules: 読み込んだログに含まれるモジュール（前回と同じ場合は何もしない）
+        """
+        if modules == self._known_modules:
+            return
+        self._known_modules = modules
         
-        # 以前の選択を復元
-        if current_selection:
-            index = self.module_combo.findData(current_selection)
-            if index >= 0:
-                self.module_combo.setCurrentIndex(index)
+        # 現在の選択を保存
+        current_selection = self.module_combo.currentData()
+        
+        # 作り直しの間はシグナルをブロック（例外時も確実に解除される）
+        with QSignalBlocker(self.module_combo):
+            # コンボボックスをクリア
+            self.module_combo.clear()
+            self.module_combo.addItem("すべてのモジュール", None)
+            
+            # モジュールリストをコンボボックスに追加
+            for module in sorted(modules):
+                self.module_combo.addItem(module, module)
+            
+            # 以前の選択を復元
+            if current_selection:
+                index = self.module_combo.findData(current_selection)
+                if index >= 0:
+                    self.module_combo.setCurrentIndex(index)
     
-        # シグナルのブロックを解除（追加）
-        self.module_combo.blockSignals(False)
+    def on_search_text_changed(self, text: str):
+        """
+        検索テキストの変更時に表示中のログを絞り込む
+        
+        Args:
+            text: 検索テキスト
+        """
+        self.error_proxy.setFilterFixedString(text)
+        self.update_statistics()
+    
+    def visible_logs(self) -> List[Dict[str, Any]]:
+        """
+        テキスト検索で絞り込んだ後の、表示中のログを取得
+        
+        Returns:
+            表示中のエラーログのリスト
+        """
+        if not self.search_edit.text():
+            return self.error_logs
+        
+        proxy = self.error_proxy
+        log_at = self.error_model.log_at
+        return [log_at(proxy.mapToSource(proxy.index(row, 0)).row()) for row in range(proxy.rowCount())]
     
     def update_statistics(self):
-        """統計情報を更新"""
-        # エラーレベル別のカウント
-        critical_count = 0
-        error_count = 0
-        warning_count = 0
-        
-        for log in self.error_logs:
-            level = log.get("level")
-            if level == LogLevel.CRITICAL:
-                critical_count += 1
-            elif level == LogLevel.ERROR:
-                error_count += 1
-            elif level == LogLevel.WARNING:
-                warning_count += 1
-        
-        # ラベルを更新
-        self.total_errors_label.setText(f"総エラー数: {len(self.error_logs)}")
-        self.critical_count_label.setText(f"CRITICAL: {critical_count}")
-        self.error_count_label.setText(f"ERROR: {error_count}")
-        self.warning_count_label.setText(f"WARNING: {warning_count}")
+        """統計情報を更新（テキスト検索中は表示中のログを集計する）"""
+        if self.search_edit.text():
+            logs = self.visible_logs()
+            level_counts = Counter(log.get("level") for log in logs)
+        else:
+            logs = self.error_logs
+            level_counts = self._level_counts
+        
+        self.total_errors_label.setText(f"総エラー数: {len(logs)}")
+        self.critical_count_label.setText(f"CRITICAL: {level_counts[LogLevel.CRITICAL]}")
+        self.error_count_label.setText(f"ERROR: {level_counts[LogLevel.ERROR]}")
+        self.warning_count_label.setText(f"WARNING: {level_counts[LogLevel.WARNING]}")
     
     def apply_filters(self):
         """フィルターを適用してログを再読み込み"""
@@ -536,32 +784,30 @@ class ErrorLogTab(QWidget):
         # ログを再読み込み
         self.load_error_logs()
     
-    def show_error_details(self, row, col):
+    def show_error_details(self, index: QModelIndex):
         """
         エラーの詳細情報ダイアログを表示
         
         Args:
-            row: クリックされた行
-            col: クリックされた列
+            index: クリックされたセルのインデックス
         """
-        error_data = self.error_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        error_data = self.error_model.log_at(self.error_proxy.mapToSource(index).row())
         if error_data:
-            dialog = ErrorDetailsDialog(self, error_data)
-            dialog.exec()
+            if self._details_dialog is None:
+                self._details_dialog = ErrorDetailsDialog(self)
+            self._details_dialog.set_error_data(error_data)
+            self._details_dialog.exec()
     
     def view_selected_error(self):
         """選択されたエラーの詳細を表示"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_data = self.error_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-            if error_data:
-                dialog = ErrorDetailsDialog(self, error_data)
-                dialog.exec()
+        selected_rows = self.error_table.selectionModel().selectedRows()
+        if selected_rows:
+            self.show_error_details(selected_rows[0])
     
     def export_error_logs(self):
         """現在表示されているエラーログをファイルにエクスポート"""
-        if not self.error_logs:
+        filtered_logs = self.visible_logs()
+        if not filtered_logs:
             show_info_message(self, "エクスポート", "エクスポートするエラーログがありません")
             return
         
@@ -576,49 +822,27 @@ class ErrorLogTab(QWidget):
             return
         
         try:
-            # 検索テキストでフィルタリングしたログを取得
-            search_text = self.search_edit.text().lower()
-            filtered_logs = []
-            
-            for log in self.error_logs:
-                if search_text:
-                    message = str(log.get("message", "")).lower()
-                    module = str(log.get("module", "")).lower()
-                    function = str(log.get("function", "")).lower()
-                    
-                    if (search_text in message or search_text in module or search_text in function):
-                        filtered_logs.append(log)
-                else:
-                    filtered_logs.append(log)
-            
             # ファイル拡張子に応じてフォーマットを変更
             if filename.endswith('.json'):
-                import json
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(filtered_logs, f, ensure_ascii=False, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(_json_dumps([_without_display_fields(log) for log in filtered_logs]))
             elif filename.endswith('.csv'):
-                import csv
-                with open(filename, 'w', encoding='utf-8', newline='') as f:
+                with open(filename, 'w', encoding='utf-8', newline='', buffering=_EXPORT_BUFFER_SIZE) as f:
                     writer = csv.writer(f)
                     # ヘッダー行
                     writer.writerow(["発生日時", "レベル", "メッセージ", "モジュール", "関数"])
                     
-                    # データ行
-                    for log in filtered_logs:
-                        timestamp = "不明"
-                        try:
-                            if "timestamp" in log:
-                                timestamp = datetime.fromisoformat(log["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
-                        except (ValueError, TypeError):
-                            pass
-                        
-                        writer.writerow([
-                            timestamp,
+                    # データ行（発生日時は読み込み時に整形済み）
+                    writer.writerows(
+                        (
+                            log["_display_ts"],
                             log.get("level", "不明"),
                             log.get("message", "不明"),
                             log.get("module", "不明"),
                             log.get("function", "不明")
-                        ])
+                        )
+                        for log in filtered_logs
+                    )
             
             show_info_message(self, "エクスポート成功", "エラーログのエクスポートに成功しました")
         except Exception as e:
@@ -4,18 +4,71 @@
 Excelダイアログ
 Excel入出力のためのダイアログ
 """
+import os
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QRadioButton, QButtonGroup, QGroupBox,
     QMessageBox, QComboBox, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QThread, QSettings, pyqtSignal
 
-# 相対パスを使用する場合
-from ...excel.excel_importer import ExcelImporter
-from ...excel.excel_exporter import ExcelExporter
 # 正しいインポート (相対パスを使用する場合)
 from ...core.manager import get_project_manager
+from ...core.error_handler import log_exception
+
+# 最後に選択したファイルのフォルダを保存する QSettings のキー
+_LAST_DIR_KEY = "excel/last_dir"
+
+# インポートフォーマットの選択肢（フォーマット種別, 表示名, ボタンID）
+_FORMAT_OPTIONS = (
+    ("auto", "自動検出", 1),
+    ("standard", "標準フォーマット", 2),
+    ("ms_project", "MS Project類似", 3),
+    ("simple", "シンプルフォーマット", 4),
+)
+
+# 各フォーマットの説明
+_FORMAT_INFO_TEXT = (
+    "フォーマット情報:\n"
+    "・自動検出: シート構造を分析して最適なフォーマットを選択\n"
+    "・標準フォーマット: スケジュールシートと入力シートを持つ形式\n"
+    "・MS Project類似: タスクシートとリソースシートを持つ形式\n"
+    "・シンプルフォーマット: 単一シートのシンプルな形式"
+)
+
+
+class ExcelWorker(QObject):
+    """
+    Excelの読み書きをバックグラウンドスレッドで実行するワーカー
+    """
+    
+    finished = pyqtSignal(object)  # 処理結果
+    error = pyqtSignal(str)  # エラーメッセージ
+    
+    def __init__(self, func, *args):
+        """
+        ワーカーの初期化
+        
+        Args:
+            func: 実行する処理（インポーター・エクスポーターのメソッド）
+            *args: 処理に渡す引数
+        """
+        super().__init__()
+        
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        """処理を実行し、結果またはエラーを通知"""
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            log_exception(e, "Excel operation failed")
+            self.error.emit(str(e))
+            return
+        
+        self.finished.emit(result)
 
 
 class ExcelOperationDialog(QDialog):
@@ -35,8 +88,14 @@ class ExcelOperationDialog(QDialog):
         
         self.parent = parent
         self.controller = controller
-        self.importer = ExcelImporter()
-        self.exporter = ExcelExporter()
+        # インポーター・エクスポーターは openpyxl の読み込みを伴うため、初めて使うときに作成する
+        self.importer = None
+        self.exporter = None
+        
+        # 実行中のワーカー（Excelの読み書きはUIスレッドの外で行う）
+        self._worker_thread = None
+        self._worker = None
+        self._export_project_name = ""
         
         self.init_ui()
     
@@ -95,33 +154,19 @@ class ExcelOperationDialog(QDialog):
         self.format_group = QGroupBox("フォーマット設定")
         format_layout = QVBoxLayout(self.format_group)
         
-        self.format_auto_radio = QRadioButton("自動検出")
-        self.format_standard_radio = QRadioButton("標準フォーマット")
-        self.format_ms_project_radio = QRadioButton("MS Project類似")
-        self.format_simple_radio = QRadioButton("シンプルフォーマット")
-        
         self.format_group_btn = QButtonGroup()
-        self.format_group_btn.addButton(self.format_auto_radio, 1)
-        self.format_group_btn.addButton(self.format_standard_radio, 2)
-        self.format_group_btn.addButton(self.format_ms_project_radio, 3)
-        self.format_group_btn.addButton(self.format_simple_radio, 4)
+        for _, label, button_id in _FORMAT_OPTIONS:
+            radio = QRadioButton(label)
+            self.format_group_btn.addButton(radio, button_id)
+            format_layout.addWidget(radio)
         
         # デフォルトで自動検出を選択
-        self.format_auto_radio.setChecked(True)
-        
-        format_layout.addWidget(self.format_auto_radio)
-        format_layout.addWidget(self.format_standard_radio)
-        format_layout.addWidget(self.format_ms_project_radio)
-        format_layout.addWidget(self.format_simple_radio)
+        self.format_group_btn.button(1).setChecked(True)
         
         import_options_layout.addWidget(self.format_group)
         
         # 各フォーマットの説明
-        format_info = QLabel("フォーマット情報:\n"
-                           "・自動検出: シート構造を分析して最適なフォーマットを選択\n"
-                           "・標準フォーマット: スケジュールシートと入力シートを持つ形式\n"
-                           "・MS Project類似: タスクシートとリソースシートを持つ形式\n"
-                           "・シンプルフォーマット: 単一シートのシンプルな形式")
+        format_info = QLabel(_FORMAT_INFO_TEXT)
         format_info.setWordWrap(True)
         import_options_layout.addWidget(format_info)
         
@@ -176,12 +221,16 @@ class ExcelOperationDialog(QDialog):
         """ファイル選択ダイアログを表示"""
         is_import = self.import_radio.isChecked()
         
+        # 前回選択したフォルダから開く
+        settings = QSettings("Ichimoku", "PM")
+        start_directory = settings.value(_LAST_DIR_KEY, "", type=str)
+        
         if is_import:
             # インポート時はファイル選択
             file_path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Excelファイルを選択",
-                "",
+                start_directory,
                 "Excelファイル (*.xlsx *.xls *.xlsm)"
             )
         else:
@@ -189,7 +238,7 @@ class ExcelOperationDialog(QDialog):
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "保存先を選択",
-                "",
+                start_directory,
                 "Excelファイル (*.xlsx *.xlsm)"
             )
             
@@ -198,6 +247,7 @@ class ExcelOperationDialog(QDialog):
                 file_path += '.xlsx'
         
         if file_path:
+            settings.setValue(_LAST_DIR_KEY, os.path.dirname(file_path))
             self.file_path_label.setText(file_path)
             self.execute_button.setEnabled(True)
         
@@ -218,28 +268,93 @@ class ExcelOperationDialog(QDialog):
             # Excelにエクスポート
             self.export_to_excel()
     
+    def reject(self):
+        """キャンセル（読み書きの実行中は閉じない）"""
+        if self._worker_thread is not None:
+            return
+        super().reject()
+    
+    def _run_in_background(self, on_done, func, *args):
+        """
+        Excelの読み書きをワーカースレッドで実行
+        
+        Args:
+            on_done: 完了時に結果を受け取る関数
+            func: 実行する処理
+            *args: 処理に渡す引数
+        """
+        # 実行中は操作できないようにする
+        self.execute_button.setEnabled(False)
+        self.browse_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        
+        self._worker_thread = QThread(self)
+        self._worker = ExcelWorker(func, *args)
+        self._worker.moveToThread(self._worker_thread)
+        
+        self._worker_thread.started.connect(self._worker.run)
+        self._worker.finished.connect(on_done)
+        self._worker.error.connect(self._on_worker_error)
+        for signal in (self._worker.finished, self._worker.error):
+            signal.connect(self._worker_thread.quit)
+            signal.connect(self._worker.deleteLater)
+        self._worker_thread.finished.connect(self._worker_thread.deleteLater)
+        
+        self._worker_thread.start()
+    
+    def _finish_background(self):
+        """ワーカー完了時にスレッドの終了を待ち、UIの状態を元に戻す"""
+        # ダイアログを閉じる前にスレッドを確実に停止させる（実行中に破棄されるのを防ぐ）
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        
+        self._worker_thread = None
+        self._worker = None
+        self.execute_button.setEnabled(True)
+        self.browse_button.setEnabled(True)
+        self.cancel_button.setEnabled(True)
+    
+    def _on_worker_error(self, message: str):
+        """
+        ワーカーで例外が発生した場合の処理
+        
+        Args:
+            message: エラーメッセージ
+        """
+        self._finish_background()
+        QMessageBox.critical(self, "エラー", f"Excelの処理中にエラーが発生しました。\n詳細: {message}")
+    
     def import_from_excel(self):
-        """Excelからプロジェクトをインポート"""
+        """Excelからプロジェクトをインポート（読み込みはワーカースレッドで行う）"""
+        # デバッグ情報を追加
+        print(f"インポート開始: {self.file_path}")
+        
+        # フォーマット選択を取得
+        checked_id = self.format_group_btn.checkedId()
+        format_type = next(
+            (fmt for fmt, _, button_id in _FORMAT_OPTIONS if button_id == checked_id),
+            "auto"  # 自動検出
+        )
+        
+        # インポーターにフォーマット情報を渡す
+        if self.importer is None:
+            from ...excel.excel_importer import ExcelImporter
+            self.importer = ExcelImporter()
+        self.importer.set_format_type(format_type)
+        
+        # ファイルからプロジェクトをインポート
+        self._run_in_background(self._on_import_done, self.importer.import_from_file, self.file_path)
+    
+    def _on_import_done(self, project):
+        """
+        インポート完了時にプロジェクトをシステムに登録
+        
+        Args:
+            project: インポートされたプロジェクト（失敗時はNone）
+        """
+        self._finish_background()
+        
         try:
-            # デバッグ情報を追加
-            print(f"インポート開始: {self.file_path}")
-            
-            # フォーマット選択を取得
-            if self.format_standard_radio.isChecked():
-                format_type = "standard"
-            elif self.format_ms_project_radio.isChecked():
-                format_type = "ms_project"
-            elif self.format_simple_radio.isChecked():
-                format_type = "simple"
-            else:
-                format_type = "auto"  # 自動検出
-            
-            # インポーターにフォーマット情報を渡す
-            self.importer.set_format_type(format_type)
-            
-            # ファイルからプロジェクトをインポート
-            project = self.importer.import_from_file(self.file_path)
-            
             if not project:
                 QMessageBox.critical(self, "エラー", "プロジェクトのインポートに失敗しました。ファイル形式を確認してください。")
                 return
@@ -282,24 +397,33 @@ class ExcelOperationDialog(QDialog):
             QMessageBox.critical(self, "エラー", f"プロジェクトのインポートに失敗しました。\n詳細: {str(e)}")
     
     def export_to_excel(self):
-        """プロジェクトをExcelにエクスポート"""
+        """プロジェクトをExcelにエクスポート（書き込みはワーカースレッドで行う）"""
         manager = get_project_manager()
         
         if not manager.current_project:
             QMessageBox.warning(self, "警告", "エクスポートするプロジェクトが開かれていません")
             return
         
-        try:
-            # プロジェクトをエクスポート
-            include_tasks = self.include_tasks_check.isChecked()
-            
-            success = self.exporter.export_to_file(manager.current_project, self.file_path)
-            
-            if success:
-                QMessageBox.information(self, "成功", f"プロジェクト「{manager.current_project.name}」をExcelにエクスポートしました")
-                self.accept()
-            else:
-                QMessageBox.critical(self, "エラー", "エクスポートに失敗しました")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "エラー", f"エクスポート中にエラーが発生しました: {str(e)}")
+        # プロジェクトをエクスポート
+        if self.exporter is None:
+            from ...excel.excel_exporter import ExcelExporter
+            self.exporter = ExcelExporter()
+        self._export_project_name = manager.current_project.name
+        self._run_in_background(
+            self._on_export_done, self.exporter.export_to_file, manager.current_project, self.file_path
+        )
+    
+    def _on_export_done(self, success):
+        """
+        エクスポート完了時の処理
+        
+        Args:
+            success: エクスポートが成功したかどうか
+        """
+        self._finish_background()
+        
+        if success:
+            QMessageBox.information(self, "成功", f"プロジェクト「{self._export_project_name}」をExcelにエクスポートしました")
+            self.accept()
+        else:
+            QMessageBox.critical(self, "エラー", "エクスポートに失敗しました")
@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QComboBox, QToolBar, QFrame, QSplitter, QScrollArea, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize
 from PyQt6.QtGui import QIcon, QAction
 
 from .gantt_chart_widget import GanttChartWidget
@@ -42,6 +42,7 @@ class GanttChartTab(QWidget):
         self.controller.phases_changed.connect(self.refresh_gantt_chart)
         self.controller.processes_changed.connect(self.refresh_gantt_chart)
         self.controller.tasks_changed.connect(self.refresh_gantt_chart)
+        self.controller.hierarchy_changed.connect(self.refresh_gantt_chart)
     
     def init_ui(self):
         """UIの初期化"""
@@ -146,6 +147,7 @@ class GanttChartTab(QWidget):
         self.selected_item_type = None
         self.selected_item_id = None
     
+    @pyqtSlot()
     def refresh_gantt_chart(self):
         """ガントチャートを更新"""
         project_data = self.get_chart_data()
@@ -15,6 +15,30 @@ from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QWheelEvent, QMou
 from ...models import ProjectStatus, TaskStatus
 
 
+def _parse_iso(value: str) -> Optional[datetime]:
+    """ISO形式の日付文字列を変換（明らかに短い文字列は例外を起こさずにNone）"""
+    if len(value) < 10:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+# 日付値の型ごとの変換処理（str / datetime / None のいずれかが渡される）
+_DATE_HANDLERS = {
+    str: _parse_iso,
+    datetime: lambda value: value,
+    type(None): lambda value: None
+}
+_NO_DATE = lambda value: None
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """日付値を datetime に揃える（未対応の型はNone）"""
+    return _DATE_HANDLERS.get(type(value), _NO_DATE)(value)
+
+
 class GanttChartWidget(QWidget):
     """
     プロジェクトのガントチャートを表示するウィジェット
@@ -103,7 +127,11 @@ class GanttChartWidget(QWidget):
         self.update()
     
     def prepare_chart_data(self):
-        """プロジェクトデータからガントチャート表示用のデータを準備"""
+        """
+        プロジェクトデータからガントチャート表示用のデータを準備
+        
+        日付はここで datetime に揃え、描画のたびに文字列を解析しないようにする
+        """
         self.chart_data = []
         
         if not self.project_data:
@@ -115,8 +143,8 @@ class GanttChartWidget(QWidget):
             "name": self.project_data["name"],
             "type": "project",
             "level": 0,
-            "start_date": self.project_data.get("start_date"),
-            "end_date": self.project_data.get("end_date"),
+            "start_date": _to_datetime(self.project_data.get("start_date")),
+            "end_date": _to_datetime(self.project_data.get("end_date")),
             "progress": self.project_data.get("progress", 0),
             "status": self.project_data.get("status", "")
         })
@@ -128,8 +156,8 @@ class GanttChartWidget(QWidget):
                 "name": phase["name"],
                 "type": "phase",
                 "level": 1,
-                "start_date": phase.get("start_date"),
-                "end_date": phase.get("end_date"),
+                "start_date": _to_datetime(phase.get("start_date")),
+                "end_date": _to_datetime(phase.get("end_date")),
                 "progress": phase.get("progress", 0),
                 "parent_id": self.project_data["id"]
             })
@@ -141,8 +169,8 @@ class GanttChartWidget(QWidget):
                     "name": process["name"],
                     "type": "process",
                     "level": 2,
-                    "start_date": process.get("start_date"),
-                    "end_date": process.get("end_date"),
+                    "start_date": _to_datetime(process.get("start_date")),
+                    "end_date": _to_datetime(process.get("end_date")),
                     "progress": process.get("progress", 0),
                     "assignee": process.get("assignee", ""),
                     "parent_id": phase["id"]
@@ -202,16 +230,10 @@ class GanttChartWidget(QWidget):
             end_date = item.get("end_date")
             
             if start_date:
-                if isinstance(start_date, str):
-                    start_date = datetime.fromisoformat(start_date)
-                
                 if min_date is None or start_date < min_date:
                     min_date = start_date
             
             if end_date:
-                if isinstance(end_date, str):
-                    end_date = datetime.fromisoformat(end_date)
-                
                 if max_date is None or end_date > max_date:
                     max_date = end_date
         
@@ -555,12 +577,6 @@ class GanttChartWidget(QWidget):
             start_date = item.get("start_date")
             end_date = item.get("end_date")
             
-            # 日付文字列をdatetimeに変換
-            if start_date and isinstance(start_date, str):
-                start_date = datetime.fromisoformat(start_date)
-            if end_date and isinstance(end_date, str):
-                end_date = datetime.fromisoformat(end_date)
-            
             # 開始日または終了日がない場合はバーを描画しない
             if not start_date or not end_date:
                 continue
@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QSplitter, QTreeWidget, QTreeWidgetItem, QProgressBar, QMenu,
     QMessageBox, QComboBox, QStatusBar, QToolBar, QApplication
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, pyqtSlot, QTimer
 from PyQt6.QtGui import QAction, QIcon, QColor, QFont
 
 from .controller import GUIController
@@ -29,6 +29,9 @@ from .utils import (
 
 from ...models import ProjectStatus, TaskStatus
 
+# 詳細表示に載せるタスク履歴の件数（最新のものから）
+_TASK_HISTORY_LIMIT = 50
+
 
 class MainWindow(QMainWindow):
     """
@@ -51,6 +54,12 @@ class MainWindow(QMainWindow):
         self.controller.phases_changed.connect(self.refresh_phases_view)
         self.controller.processes_changed.connect(self.refresh_processes_view)
         self.controller.tasks_changed.connect(self.refresh_tasks_view)
+        self.controller.hierarchy_changed.connect(self.on_hierarchy_changed)
+        self.controller.all_processes_loaded.connect(self.on_all_processes_loaded)
+        self.controller.notifications_changed.connect(self.update_notification_badge)
+        
+        # 最後に取得した全プロセス一覧（フィルター変更時は再取得しない）
+        self.all_processes = []
         
         # 更新タイマー（自動保存用）
         self.save_timer = QTimer(self)
@@ -1206,6 +1215,7 @@ class MainWindow(QMainWindow):
             else:
                 show_error_message(self, "エラー", "タスクの削除に失敗しました")
     
+    @pyqtSlot()
     def refresh_project_view(self):
         """プロジェクト詳細ビューを更新"""
         project_data = self.controller.get_current_project()
@@ -1251,6 +1261,7 @@ class MainWindow(QMainWindow):
         """
         self.project_progress_info.setText(progress_info)
     
+    @pyqtSlot()
     def refresh_phases_view(self):
         """フェーズツリーを更新"""
         project_data = self.controller.get_current_project()
@@ -1326,6 +1337,7 @@ class MainWindow(QMainWindow):
                     task_item.setData(0, Qt.ItemDataRole.UserRole, task["id"])
                     task_item.setData(0, Qt.ItemDataRole.UserRole + 1, "task")
     
+    @pyqtSlot(str)
     def refresh_processes_view(self, phase_id: str):
         """
         指定したフェーズのプロセスビューを更新
@@ -1392,6 +1404,21 @@ class MainWindow(QMainWindow):
                 
                 break
     
+    @pyqtSlot(str, str)
+    def on_hierarchy_changed(self, phase_id: str, process_id: str):
+        """
+        タスクの変更で上位階層まで影響した場合のビュー更新
+        
+        Args:
+            phase_id: フェーズID
+            process_id: プロセスID
+        """
+        self.refresh_tasks_view(phase_id, process_id)
+        # フェーズツリーの再構築でプロセス・タスクの行も更新される
+        self.refresh_phases_view()
+        self.refresh_project_view()
+    
+    @pyqtSlot(str, str)
     def refresh_tasks_view(self, phase_id: str, process_id: str):
         """
         指定したプロセスのタスクビューを更新
@@ -1487,13 +1514,22 @@ class MainWindow(QMainWindow):
                 break
     
     def refresh_all_processes(self):
-        """全プロセス一覧を更新"""
+        """全プロセス一覧を更新（取得はバックグラウンドで行い、完了時に反映）"""
+        self.controller.request_all_processes()
+    
+    @pyqtSlot(list)
+    def on_all_processes_loaded(self, processes):
+        """
+        バックグラウンドで取得した全プロセス一覧を反映
+        
+        Args:
+            processes: 全プロセス一覧
+        """
+        self.all_processes = processes
+        
         # 担当者フィルターを更新
         self.update_assignee_filter()
         
-        # プロセスデータを取得
-        processes = self.controller.get_all_processes()
-        
         # フィルタリングを適用
         self.filtered_processes = self.filter_processes(processes)
         
@@ -1504,15 +1540,16 @@ class MainWindow(QMainWindow):
         """担当者フィルターの選択肢を更新"""
         current_assignee = self.assignee_filter.currentData()
         
+        # 選択肢の入れ替え中にフィルター適用が走らないようにする
+        self.assignee_filter.blockSignals(True)
         self.assignee_filter.clear()
         self.assignee_filter.addItem("すべての担当者", None)
         
         assignees = set()
-        processes = self.controller.get_all_processes()
         
-        for process in processes:
-            if process.get("assignee"):
-                assignees.add(process["assignee"])
+        for process in self.all_processes:
+            if process.assignee:
+                assignees.add(process.assignee)
         
         for assignee in sorted(assignees):
             self.assignee_filter.addItem(assignee, assignee)
@@ -1522,6 +1559,7 @@ class MainWindow(QMainWindow):
             index = self.assignee_filter.findData(current_assignee)
             if index >= 0:
                 self.assignee_filter.setCurrentIndex(index)
+        self.assignee_filter.blockSignals(False)
 
     def filter_processes(self, processes):
         """プロセスをフィルタリング"""
@@ -1530,29 +1568,28 @@ class MainWindow(QMainWindow):
         # 担当者でフィルター
         assignee = self.assignee_filter.currentData()
         if assignee:
-            filtered = [p for p in filtered if p.get("assignee") == assignee]
+            filtered = [p for p in filtered if p.assignee == assignee]
         
         # 状態でフィルター
         status = self.status_filter.currentData()
         if status:
-            filtered = [p for p in filtered if p.get("status") == status]
+            filtered = [p for p in filtered if getattr(p, "status", None) == status]
         
         # 期限でフィルター
         deadline_days = self.deadline_filter.currentData()
         if deadline_days is not None and deadline_days != 0:
             if deadline_days < 0:
                 # 期限切れ
-                filtered = [p for p in filtered if p.get("days_remaining") is not None and p.get("days_remaining") < 0]
+                filtered = [p for p in filtered if p.days_remaining is not None and p.days_remaining < 0]
             else:
                 # X日以内
-                filtered = [p for p in filtered if p.get("days_remaining") is not None and 0 <= p.get("days_remaining") <= deadline_days]
+                filtered = [p for p in filtered if p.days_remaining is not None and 0 <= p.days_remaining <= deadline_days]
         
         return filtered
 
     def apply_process_filters(self):
         """フィルターを適用してプロセス一覧を更新"""
-        processes = self.controller.get_all_processes()
-        self.filtered_processes = self.filter_processes(processes)
+        self.filtered_processes = self.filter_processes(self.all_processes)
         self.populate_processes_table()
 
     def populate_processes_table(self):
@@ -1561,31 +1598,31 @@ class MainWindow(QMainWindow):
         
         for row, process in enumerate(self.filtered_processes):
             # プロジェクト
-            self.processes_table.setItem(row, 0, QTableWidgetItem(process["project_name"]))
+            self.processes_table.setItem(row, 0, QTableWidgetItem(process.project_name))
             
             # フェーズ
-            self.processes_table.setItem(row, 1, QTableWidgetItem(process["phase_name"]))
+            self.processes_table.setItem(row, 1, QTableWidgetItem(process.phase_name))
             
             # プロセス名
-            self.processes_table.setItem(row, 2, QTableWidgetItem(process["name"]))
+            self.processes_table.setItem(row, 2, QTableWidgetItem(process.name))
             
             # 担当者
-            self.processes_table.setItem(row, 3, QTableWidgetItem(process.get("assignee", "")))
+            self.processes_table.setItem(row, 3, QTableWidgetItem(process.assignee))
             
             # 進捗率
-            progress_item = QTableWidgetItem(format_progress(process["progress"]))
+            progress_item = QTableWidgetItem(format_progress(process.progress))
             self.processes_table.setItem(row, 4, progress_item)
             
             # 開始日
-            start_date = process.get("start_date")
+            start_date = process.start_date
             self.processes_table.setItem(row, 5, QTableWidgetItem(format_date(start_date)))
             
             # 終了日
-            end_date = process.get("end_date")
+            end_date = process.end_date
             self.processes_table.setItem(row, 6, QTableWidgetItem(format_date(end_date)))
             
             # 残り日数
-            days_remaining = process.get("days_remaining")
+            days_remaining = process.days_remaining
             days_item = QTableWidgetItem(str(days_remaining) if days_remaining is not None else "未設定")
             
             # 期限切れは赤、1週間以内は黄色で表示
@@ -1621,9 +1658,9 @@ class MainWindow(QMainWindow):
 
     def view_process_detail(self, process):
         """プロセスの詳細ページを表示"""
-        project_id = process["project_id"]
-        phase_id = process["phase_id"]
-        process_id = process["id"]
+        project_id = process.project_id
+        phase_id = process.phase_id
+        process_id = process.id
         
         # プロジェクトを読み込む
         self.controller.load_project(project_id)
@@ -1640,9 +1677,9 @@ class MainWindow(QMainWindow):
 
     def edit_process_from_list(self, process):
         """プロセス一覧からプロセスを編集"""
-        project_id = process["project_id"]
-        phase_id = process["phase_id"]
-        process_id = process["id"]
+        project_id = process.project_id
+        phase_id = process.phase_id
+        process_id = process.id
         
         # プロジェクトを読み込む（一時的に）
         current_project_id = None
@@ -1795,9 +1832,14 @@ class MainWindow(QMainWindow):
                 """
                 
                 # タスク履歴を追加
-                history = self.controller.get_task_history(item_id)
+                # 省略の有無を判定するため1件多く取得する
+                history = self.controller.get_task_history(item_id, limit=_TASK_HISTORY_LIMIT + 1)
                 if history:
-                    detail_text += "<p><b>履歴:</b></p><ul>"
+                    detail_text += "<p><b>履歴:</b></p>"
+                    if len(history) > _TASK_HISTORY_LIMIT:
+                        history = history[1:]
+                        detail_text += f"<p>（最新{_TASK_HISTORY_LIMIT}件を表示）</p>"
+                    detail_text += "<ul>"
                     for entry in history:
                         timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%Y-%m-%d %H:%M")
                         action = entry["action_type"]
@@ -1987,10 +2029,14 @@ class MainWindow(QMainWindow):
                 self.tab_widget.setCurrentIndex(i)
                 break
 
-    def update_notification_badge(self):
-        """通知バッジを更新"""
-        unread_count = self.controller.get_unread_notifications_count()
+    @pyqtSlot(int)
+    def update_notification_badge(self, unread_count: int):
+        """
+        通知バッジを更新
         
+        Args:
+            unread_count: 未読通知の数
+        """
         if unread_count > 0:
             self.notification_badge.setText(str(unread_count))
             self.notification_badge.setVisible(True)
@@ -39,7 +39,8 @@ class NotificationTab(QWidget):
         
         # 自動更新タイマー
         self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.check_new_notifications)
+        self.refresh_timer.timeout.connect(self.controller.request_notification_check)
+        self.controller.notifications_checked.connect(self.on_notifications_checked)
         
         self.init_ui()
         
@@ -350,8 +351,15 @@ class NotificationTab(QWidget):
     
     def check_new_notifications(self):
         """新しい通知をチェック"""
-        new_count = self.notification_manager.generate_notifications()
+        self.on_notifications_checked(self.notification_manager.generate_notifications())
+    
+    def on_notifications_checked(self, new_count: int):
+        """
+        通知チェックの結果を反映
         
+        Args:
+            new_count: 新しく生成された通知の数
+        """
         if new_count > 0:
             # 新しい通知がある場合はリストを更新
             self.load_notifications()
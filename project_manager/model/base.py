@@ -25,6 +25,8 @@ class BaseEntity:
         self.updated_at: datetime = datetime.now()
         self.parent = None
         self.children: List[BaseEntity] = []
+        # IDから子エンティティを引く索引（最初の検索時に構築）
+        self._children_by_id: Optional[Dict[str, BaseEntity]] = None
     
     def update(self, name: Optional[str] = None, description: Optional[str] = None) -> None:
         """
@@ -49,6 +51,8 @@ class BaseEntity:
         """
         child.parent = self
         self.children.append(child)
+        if self._children_by_id is not None:
+            self._children_by_id[child.id] = child
         self.updated_at = datetime.now()
     
     def remove_child(self, child_id: str) -> Optional['BaseEntity']:
@@ -65,6 +69,8 @@ class BaseEntity:
             if child.id == child_id:
                 removed_child = self.children.pop(i)
                 removed_child.parent = None
+                if self._children_by_id is not None:
+                    self._children_by_id.pop(child_id, None)
                 self.updated_at = datetime.now()
                 return removed_child
         return None
@@ -79,10 +85,25 @@ class BaseEntity:
         Returns:
             見つかった子エンティティ、存在しない場合はNone
         """
-        for child in self.children:
-            if child.id == child_id:
-                return child
-        return None
+        index = self._children_by_id
+        if index is None:
+            index = self._rebuild_child_index()
+        
+        child = index.get(child_id)
+        if child is not None and child.id != child_id:
+            # 追加後にIDが変更された場合は索引を作り直す
+            child = self._rebuild_child_index().get(child_id)
+        return child
+    
+    def _rebuild_child_index(self) -> Dict[str, 'BaseEntity']:
+        """
+        子エンティティのID索引を構築
+        
+        Returns:
+            IDをキーとする子エンティティの辞書
+        """
+        self._children_by_id = {child.id: child for child in self.children}
+        return self._children_by_id
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -17,6 +17,10 @@ class TaskStatus(Enum):
     IMPOSSIBLE = "対応不能"
 
 
+# 状態から保存値を引くための表（Enum の value 参照を避ける）
+_TASK_STATUS_VALUE = {status: status.value for status in TaskStatus}
+
+
 class Task(BaseEntity):
     """プロセスのタスクを表すクラス"""
     
@@ -57,7 +61,7 @@ class Task(BaseEntity):
         """
         data = super().to_dict()
         data.update({
-            "status": self.status.value
+            "status": _TASK_STATUS_VALUE[self.status]
         })
         return data
     
@@ -69,12 +69,63 @@ class DataStore:
             )
             return False
     
-    def load_project(self, project_id: str) -> Optional[Project]:
+    def save_projects(self, projects: List[Project]) -> bool:
+        """
+        複数のプロジェクトを一括保存
+        
+        エンコーダを共有して全プロジェクトを一度にシリアライズし、
+        各ファイルは一時ファイル経由で os.replace により置き換える
+        
+        Args:
+            projects: 保存するプロジェクトのリスト
+            
+        Returns:
+            すべての保存が成功したかどうか
+        """
+        if not projects:
+            return True
+        
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        actions = []
+        failed = False
+        
+        for project in projects:
+            file_path = os.path.join(self.data_dir, f"project_{project.id}.json")
+            tmp_path = f"{file_path}.tmp"
+            try:
+                payload = encoder.encode(project.to_dict())
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, file_path)
+                actions.append({
+                    "action_type": "save",
+                    "entity_type": "Project",
+                    "entity_id": project.id,
+                    "details": {"name": project.name}
+                })
+            except Exception as e:
+                failed = True
+                actions.append({
+                    "action_type": "save_error",
+                    "entity_type": "Project",
+                    "entity_id": project.id,
+                    "details": {"error": str(e)}
+                })
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        
+        # プロジェクトごとのログを1回の書き込みでまとめて記録
+        self.logger.log_actions(actions)
+        
+        return not failed
+    
+    def load_project(self, project_id: str, log: bool = True) -> Optional[Project]:
         """
         プロジェクトを読み込み
         
         Args:
             project_id: 読み込むプロジェクトのID
+            log: 読み込みをログに記録するかどうか（バックグラウンドスレッドからはFalse）
             
         Returns:
             読み込まれたプロジェクト、存在しない場合はNone
@@ -95,21 +146,23 @@ class DataStore:
             project = Project.from_dict(project_data)
             
             # ログに記録
-            self.logger.log_action(
-                action_type="load",
-                entity_type="Project",
-                entity_id=project.id,
-                details={"name": project.name}
-            )
+            if log:
+                self.logger.log_action(
+                    action_type="load",
+                    entity_type="Project",
+                    entity_id=project.id,
+                    details={"name": project.name}
+                )
             
             return project
         except Exception as e:
-            self.logger.log_action(
-                action_type="load_error",
-                entity_type="Project",
-                entity_id=project_id,
-                details={"error": str(e)}
-            )
+            if log:
+                self.logger.log_action(
+                    action_type="load_error",
+                    entity_type="Project",
+                    entity_id=project_id,
+                    details={"error": str(e)}
+                )
             return None
     
     def delete_project(self, project_id: str) -> bool:
@@ -160,10 +213,13 @@ class DataStore:
             )
             return False
     
-    def list_projects(self) -> List[Dict[str, Any]]:
+    def list_projects(self, log: bool = True) -> List[Dict[str, Any]]:
         """
         すべてのプロジェクトの概要情報を取得
         
+        Args:
+            log: 読み込みエラーをログに記録するかどうか（バックグラウンドスレッドからはFalse）
+            
         Returns:
             プロジェクト概要情報のリスト
         """
@@ -190,12 +246,13 @@ class DataStore:
                     
                     projects.append(project_summary)
                 except Exception as e:
-                    self.logger.log_action(
-                        action_type="list_error",
-                        entity_type="Project",
-                        entity_id="unknown",
-                        details={"filename": filename, "error": str(e)}
-                    )
+                    if log:
+                        self.logger.log_action(
+                            action_type="list_error",
+                            entity_type="Project",
+                            entity_id="unknown",
+                            details={"filename": filename, "error": str(e)}
+                        )
         
         # 更新日時でソート（最新のものが先頭）
         projects.sort(key=lambda x: x["updated_at"], reverse=True)
@@ -263,8 +320,9 @@ class DataStore:
                 notification_data = json.load(f)
             
             # ログに記録
-            self.logger.log_action(
-                action_type="load",
+            if log:
+                self.logger.log_action(
+                    action_type="load",
                 entity_type="Notification",
                 entity_id=notification_id,
                 details={"message": notification_data.get("message", "")}